@@ -2,17 +2,28 @@
 Core game systems package
 """
 from core.game import Game
-from core.physics import check_collision, resolve_collision, circle_contains_point
-from core.utils import lerp, distance, clamp, normalize_vector, angle_between
+from core.physics import (
+    check_collision, resolve_collision, resolve_collisions,
+    find_colliding_pairs, find_colliding_pairs_scalar, circle_contains_point
+)
+from core.utils import (
+    lerp, distance, distance_sq, clamp, quantize_alpha,
+    normalize_vector, angle_between
+)
 
 __all__ = [
     'Game',
     'check_collision',
     'resolve_collision',
+    'resolve_collisions',
+    'find_colliding_pairs',
+    'find_colliding_pairs_scalar',
     'circle_contains_point',
     'lerp',
     'distance',
+    'distance_sq',
     'clamp',
+    'quantize_alpha',
     'normalize_vector',
     'angle_between'
 ]
\ No newline at end of file
@@ -3,42 +3,158 @@ Enhanced physics system with spatial partitioning and better collision resolutio
 """
 import pygame
 import math
-from config.settings import COLLISION_PUSH
+import numpy as np
+from config.settings import COLLISION_PUSH, SCREEN_WIDTH, SCREEN_HEIGHT
+
+# Push-apart directions for perfectly overlapping entities, cycled in turn
+_OVERLAP_DIRS = [(math.cos(a), math.sin(a))
+                 for a in np.linspace(0, 2 * math.pi, 64, endpoint=False)]
+_overlap_index = 0
+
+# End-of-list marker for SpatialGrid's index arrays
+_GRID_EMPTY = -1
+
+# Cell offsets of the 3x3 neighbourhood searched by SpatialGrid.get_nearby
+_NEIGHBOR_OFFSETS = ((-1, -1), (-1, 0), (-1, 1),
+                     (0, -1), (0, 0), (0, 1),
+                     (1, -1), (1, 0), (1, 1))
 
 class SpatialGrid:
-    """Spatial partitioning grid for efficient collision detection"""
-    def __init__(self, cell_size=100):
+    """Spatial partitioning grid for efficient collision detection
+
+    Cells are stored as a dense head array plus a per-entity "next" linked
+    list, so inserting and querying never allocates. Entities are referred
+    to by index (e.g. their position in the caller's list); configure()
+    grows the per-entity arrays to fit the entity count.
+    """
+    def __init__(self, cell_size=100, max_entities=64):
+        self._set_cell_size(cell_size)
+        self._allocate(max_entities)
+        
+    def _allocate(self, max_entities):
+        """Size the per-entity arrays for up to max_entities indices"""
+        self.max_entities = max_entities
+        self.next = np.full(max_entities, _GRID_EMPTY, dtype=np.int32)
+        self.cell_x = np.zeros(max_entities, dtype=np.int32)
+        self.cell_y = np.zeros(max_entities, dtype=np.int32)
+        self.scratch = np.empty(max_entities, dtype=np.int32)
+        
+    def _set_cell_size(self, cell_size):
+        """Resize the cell table for a new cell size"""
         self.cell_size = cell_size
-        self.grid = {}
+        self.inv_cell = 1.0 / cell_size
+        
+        # One padding cell on each side covers players drifting off-screen
+        self.cols = int(math.ceil(SCREEN_WIDTH / cell_size)) + 2
+        self.rows = int(math.ceil(SCREEN_HEIGHT / cell_size)) + 2
+        
+        self.head = np.full((self.rows, self.cols), _GRID_EMPTY, dtype=np.int32)
+        
+    def configure(self, entities):
+        """Fit the grid to the entities: capacity and cell size
+        
+        The cell size aims for about twice the average diameter (minimum
+        32), but never less than the largest possible contact distance so
+        the 3x3 search still finds every overlap.
+        """
+        if len(entities) > self.max_entities:
+            self._allocate(len(entities))
+        if not entities:
+            return
+        radii = [e.radius for e in entities]
+        avg_r = sum(radii) / len(radii)
+        cell_size = max(32, int(avg_r * 4), int(math.ceil(max(radii) * 2)))
+        if cell_size != self.cell_size:
+            self._set_cell_size(cell_size)
+        else:
+            self.clear()
         
     def clear(self):
         """Clear the grid"""
-        self.grid.clear()
+        self.head.fill(_GRID_EMPTY)
         
     def _get_cell(self, x, y):
-        """Get cell coordinates"""
-        return (int(x // self.cell_size), int(y // self.cell_size))
+        """Get cell coordinates (clamped to the grid)"""
+        cx = int(x * self.inv_cell) + 1
+        cy = int(y * self.inv_cell) + 1
+        cx = max(0, min(self.cols - 1, cx))
+        cy = max(0, min(self.rows - 1, cy))
+        return cx, cy
+        
+    def insert(self, index, x, y):
+        """Insert entity index at position (x, y)"""
+        cx, cy = self._get_cell(x, y)
+        self.cell_x[index] = cx
+        self.cell_y[index] = cy
+        self.next[index] = self.head[cy, cx]
+        self.head[cy, cx] = index
+        
+    def get_nearby(self, index):
+        """Get indices of entities in cells around an inserted entity
         
-    def insert(self, entity):
-        """Insert entity into grid"""
-        cell = self._get_cell(entity.pos.x, entity.pos.y)
-        if cell not in self.grid:
-            self.grid[cell] = []
-        self.grid[cell].append(entity)
+        Every entity lives in exactly one cell and the 3x3 cells are
+        distinct, so each index appears at most once - no dedup needed.
+        """
+        cx = int(self.cell_x[index])
+        cy = int(self.cell_y[index])
+        count = 0
         
-    def get_nearby(self, entity):
-        """Get entities in nearby cells"""
-        cx, cy = self._get_cell(entity.pos.x, entity.pos.y)
-        nearby = []
+        head = self.head
+        next_index = self.next
+        scratch = self.scratch
+        cols = self.cols
+        rows = self.rows
         
         # Check 3x3 grid around entity
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                cell = (cx + dx, cy + dy)
-                if cell in self.grid:
-                    nearby.extend(self.grid[cell])
+        for dx, dy in _NEIGHBOR_OFFSETS:
+            nx = cx + dx
+            ny = cy + dy
+            if 0 <= nx < cols and 0 <= ny < rows:
+                j = head[ny, nx]
+                while j != _GRID_EMPTY:
+                    scratch[count] = j
+                    count += 1
+                    j = next_index[j]
                     
-        return nearby
+        return scratch[:count]
+
+def find_colliding_pairs(pos_xy, radii):
+    """Brute-force broad phase: index pairs (i < j) of overlapping circles
+    
+    Cheaper than the spatial grid for a handful of entities since the whole
+    distance matrix is computed in a single array operation.
+    """
+    dx = pos_xy[:, 0, None] - pos_xy[None, :, 0]
+    rsum = radii[:, None] + radii[None, :]
+    
+    # Reject pairs already separated along x before the full distance test
+    i, j = np.nonzero(np.triu(np.abs(dx) < rsum, k=1))
+    dy = pos_xy[i, 1] - pos_xy[j, 1]
+    d2 = dx[i, j] ** 2 + dy * dy
+    keep = d2 < rsum[i, j] ** 2
+    return np.stack((i[keep], j[keep]), axis=1)
+
+def find_colliding_pairs_scalar(xs, ys, radii):
+    """Scalar broad phase over plain lists: index pairs (i < j), same order
+    
+    With only a few entities numpy's fixed per-call cost dominates, so a
+    tight triangular loop over floats returns the same pairs faster.
+    """
+    pairs = []
+    count = len(xs)
+    for i in range(count - 1):
+        x1 = xs[i]
+        y1 = ys[i]
+        r1 = radii[i]
+        for j in range(i + 1, count):
+            dx = xs[j] - x1
+            rsum = r1 + radii[j]
+            if dx >= rsum or dx <= -rsum:
+                continue
+            dy = ys[j] - y1
+            if dx * dx + dy * dy < rsum * rsum:
+                pairs.append((i, j))
+    return pairs
 
 def check_collision(entity1, entity2):
     """Check if two circular entities are colliding"""
@@ -51,78 +167,128 @@ def check_collision(entity1, entity2):
 
 def resolve_collision(entity1, entity2, dt_multiplier=1.0):
     """Enhanced collision resolution with better stability"""
+    pos1, vel1 = entity1.pos, entity1.vel
+    pos2, vel2 = entity2.pos, entity2.vel
+    
+    (pos1.x, pos1.y, vel1.x, vel1.y,
+     pos2.x, pos2.y, vel2.x, vel2.y) = _resolve_kernel(
+        pos1.x, pos1.y, vel1.x, vel1.y, entity1.radius,
+        pos2.x, pos2.y, vel2.x, vel2.y, entity2.radius,
+        dt_multiplier)
+
+def resolve_collisions(entities, pairs, dt_multiplier=1.0):
+    """Resolve a batch of colliding index pairs, in order
+    
+    Entity state is copied into flat lists once and written back once, so
+    an entity involved in several pairs only touches its Vector2s twice.
+    """
+    if len(pairs) == 0:
+        return
+        
+    xs = [e.pos.x for e in entities]
+    ys = [e.pos.y for e in entities]
+    vxs = [e.vel.x for e in entities]
+    vys = [e.vel.y for e in entities]
+    radii = [e.radius for e in entities]
+    touched = set()
+    
+    for i, j in pairs:
+        (xs[i], ys[i], vxs[i], vys[i],
+         xs[j], ys[j], vxs[j], vys[j]) = _resolve_kernel(
+            xs[i], ys[i], vxs[i], vys[i], radii[i],
+            xs[j], ys[j], vxs[j], vys[j], radii[j],
+            dt_multiplier)
+        touched.add(i)
+        touched.add(j)
+        
+    for i in touched:
+        entity = entities[i]
+        entity.pos.x = xs[i]
+        entity.pos.y = ys[i]
+        entity.vel.x = vxs[i]
+        entity.vel.y = vys[i]
+
+def _resolve_kernel(x1, y1, vx1, vy1, r1, x2, y2, vx2, vy2, r2, dt_multiplier,
+                    _PUSH=COLLISION_PUSH, _REST=0.7, _CORR=0.6, _TANG=50.0,
+                    _sqrt=math.sqrt):
+    """Collision response on plain floats; returns new positions and velocities
+    
+    The trailing underscore arguments are never passed: they bind the tuning
+    constants (and math.sqrt) as locals once, at definition time.
+    """
     # Calculate collision vector
-    dx = entity2.pos.x - entity1.pos.x
-    dy = entity2.pos.y - entity1.pos.y
-    distance = math.sqrt(dx * dx + dy * dy)
+    dx = x2 - x1
+    dy = y2 - y1
+    distance = _sqrt(dx * dx + dy * dy)
     
     # Handle perfect overlap
     if distance < 0.0001:
-        import random
-        angle = random.uniform(0, math.pi * 2)
-        dx = math.cos(angle)
-        dy = math.sin(angle)
+        global _overlap_index
+        _overlap_index = (_overlap_index + 1) % len(_OVERLAP_DIRS)
         distance = 0.0001
+        dir_x, dir_y = _OVERLAP_DIRS[_overlap_index]
+        dx = dir_x * distance
+        dy = dir_y * distance
     
     # Normalize collision vector
     nx = dx / distance
     ny = dy / distance
     
     # Calculate overlap
-    min_distance = entity1.radius + entity2.radius
+    min_distance = r1 + r2
     overlap = min_distance - distance
     
     # Position correction with damping
-    correction_factor = 0.6  # Soft correction to prevent jitter
-    correction = overlap * correction_factor
+    correction = overlap * _CORR  # Soft correction to prevent jitter
     
-    entity1.pos.x -= nx * correction
-    entity1.pos.y -= ny * correction
-    entity2.pos.x += nx * correction
-    entity2.pos.y += ny * correction
+    x1 -= nx * correction
+    y1 -= ny * correction
+    x2 += nx * correction
+    y2 += ny * correction
     
     # Velocity resolution
     # Calculate relative velocity
-    rel_vel_x = entity2.vel.x - entity1.vel.x
-    rel_vel_y = entity2.vel.y - entity1.vel.y
+    rel_vel_x = vx2 - vx1
+    rel_vel_y = vy2 - vy1
     
     # Velocity along collision normal
     vel_along_normal = rel_vel_x * nx + rel_vel_y * ny
     
     # Don't resolve if objects are separating
     if vel_along_normal > 0:
-        return
+        return x1, y1, vx1, vy1, x2, y2, vx2, vy2
     
     # Calculate impulse (with restitution for bounce)
-    restitution = 0.7
-    impulse_strength = -(1 + restitution) * vel_along_normal
+    impulse_strength = -(1 + _REST) * vel_along_normal
     impulse_strength /= 2  # Assume equal mass
     
     # Apply velocity impulse
     impulse_x = impulse_strength * nx
     impulse_y = impulse_strength * ny
     
-    entity1.vel.x -= impulse_x
-    entity1.vel.y -= impulse_y
-    entity2.vel.x += impulse_x
-    entity2.vel.y += impulse_y
+    vx1 -= impulse_x
+    vy1 -= impulse_y
+    vx2 += impulse_x
+    vy2 += impulse_y
     
     # Add gameplay push force
-    push_force = COLLISION_PUSH * dt_multiplier
-    entity1.vel.x -= nx * push_force
-    entity1.vel.y -= ny * push_force
-    entity2.vel.x += nx * push_force
-    entity2.vel.y += ny * push_force
+    push_force = _PUSH * dt_multiplier
+    vx1 -= nx * push_force
+    vy1 -= ny * push_force
+    vx2 += nx * push_force
+    vy2 += ny * push_force
     
     # Add slight tangential force for more dynamic collisions
     tangent_x = -ny
     tangent_y = nx
-    tangent_force = 50 * dt_multiplier
+    tangent_force = _TANG * dt_multiplier
+    
+    vx1 += tangent_x * tangent_force
+    vy1 += tangent_y * tangent_force
+    vx2 -= tangent_x * tangent_force
+    vy2 -= tangent_y * tangent_force
     
-    entity1.vel.x += tangent_x * tangent_force
-    entity1.vel.y += tangent_y * tangent_force
-    entity2.vel.x -= tangent_x * tangent_force
-    entity2.vel.y -= tangent_y * tangent_force
+    return x1, y1, vx1, vy1, x2, y2, vx2, vy2
 
 def circle_contains_point(circle_x, circle_y, radius, point_x, point_y):
     """Check if a point is inside a circle"""
@@ -133,17 +299,23 @@ def circle_contains_point(circle_x, circle_y, radius, point_x, point_y):
 
 def apply_drag(velocity, drag_coefficient=0.02):
     """Apply quadratic drag (more realistic than linear friction)"""
-    speed = velocity.length()
-    if speed > 0:
-        drag_force = drag_coefficient * speed * speed
-        drag_direction = velocity.normalize()
-        velocity.x -= drag_direction.x * drag_force
-        velocity.y -= drag_direction.y * drag_force
+    vx = velocity.x
+    vy = velocity.y
+    speed_sq = vx * vx + vy * vy
+    if speed_sq > 0:
+        # Drag force k*speed^2 along -velocity/speed, i.e. -k*speed*velocity
+        factor = drag_coefficient * math.sqrt(speed_sq)
+        velocity.x = vx - vx * factor
+        velocity.y = vy - vy * factor
     return velocity
 
 def clamp_velocity(velocity, max_speed=1000):
     """Clamp velocity to prevent physics explosions"""
-    speed = velocity.length()
-    if speed > max_speed:
-        velocity.scale_to_length(max_speed)
+    vx = velocity.x
+    vy = velocity.y
+    speed_sq = vx * vx + vy * vy
+    if speed_sq > max_speed * max_speed:
+        scale = max_speed / math.sqrt(speed_sq)
+        velocity.x = vx * scale
+        velocity.y = vy * scale
     return velocity
\ No newline at end of file
@@ -9,15 +9,32 @@ def lerp(start, end, t):
 
 def distance(x1, y1, x2, y2):
     """Calculate distance between two points"""
-    return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+    return math.hypot(x2 - x1, y2 - y1)
+
+def distance_sq(x1, y1, x2, y2):
+    """Squared distance between two points (for threshold checks, no sqrt)
+    
+    Works element-wise when either point is given as numpy arrays.
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    return dx * dx + dy * dy
 
 def clamp(value, min_value, max_value):
     """Clamp value between min and max"""
-    return max(min_value, min(value, max_value))
+    if value > max_value:
+        value = max_value
+    if value < min_value:
+        value = min_value
+    return value
+
+def quantize_alpha(alpha):
+    """Round an alpha down to its 16-step bucket, for keying sprite caches"""
+    return alpha & ~0x0F
 
 def normalize_vector(x, y):
     """Normalize a vector to unit length"""
-    length = math.sqrt(x * x + y * y)
+    length = math.hypot(x, y)
     if length == 0:
         return 0, 0
     return x / length, y / length
@@ -2,9 +2,37 @@
 AI Player with difficulty levels and strategic behavior
 """
 import pygame
-import random
 import math
+import numpy as np
 from entities.player import Player
+from entities.player_system import PlayerSystem
+from core.utils import distance_sq
+
+# Decision interval (ms) and aim accuracy (0-1) per difficulty
+REACTION_TIMES = {
+    'easy': 500,
+    'medium': 250,
+    'hard': 100,
+    'expert': 50
+}
+
+AIM_ACCURACY = {
+    'easy': 0.6,
+    'medium': 0.8,
+    'hard': 0.95,
+    'expert': 0.99
+}
+
+# Precomputed uniform noise in [-1, 1) for aim inaccuracy, shared by all AIs
+_NOISE_SIZE = 4096
+_NOISE = np.random.default_rng().uniform(-1.0, 1.0, _NOISE_SIZE).tolist()
+_noise_index = 0
+
+def _jitter():
+    """Next value from the shared noise table"""
+    global _noise_index
+    _noise_index = (_noise_index + 1) & (_NOISE_SIZE - 1)
+    return _NOISE[_noise_index]
 
 class AIState:
     """AI behavior states"""
@@ -23,8 +51,8 @@ class AIPlayer(Player):
         self.state = AIState.OPPORTUNISTIC
         
         # AI parameters based on difficulty
-        self.reaction_time = self._get_reaction_time()
-        self.aim_accuracy = self._get_aim_accuracy()
+        self.reaction_time = REACTION_TIMES.get(difficulty, 250)
+        self.aim_accuracy = AIM_ACCURACY.get(difficulty, 0.8)
         self.decision_delay = 0
         self.next_decision = 0
         
@@ -33,27 +61,21 @@ class AIPlayer(Player):
         self.danger_threshold = 0.3
         self.last_position = pygame.math.Vector2(x, y)
         
-    def _get_reaction_time(self):
-        """Get reaction time based on difficulty"""
-        times = {
-            'easy': 500,
-            'medium': 250,
-            'hard': 100,
-            'expert': 50
-        }
-        return times.get(self.difficulty, 250)
+        # Planned action (unit direction + dash intent)
+        self.target_dir_x = 0.0
+        self.target_dir_y = 0.0
+        self.should_dash = False
         
-    def _get_aim_accuracy(self):
-        """Get aim accuracy (0-1) based on difficulty"""
-        accuracy = {
-            'easy': 0.6,
-            'medium': 0.8,
-            'hard': 0.95,
-            'expert': 0.99
+        # Simulated key state, fed to Player.update in place of the keyboard
+        self._fake_keys = {
+            self._key_up: False,
+            self._key_down: False,
+            self._key_left: False,
+            self._key_right: False,
+            self._key_dash: False
         }
-        return accuracy.get(self.difficulty, 0.8)
         
-    def update(self, dt, players, platform):
+    def update(self, dt, players, platform, snapshot=None):
         """Update AI logic"""
         if not self.alive:
             return
@@ -64,44 +86,57 @@ class AIPlayer(Player):
         # Make decisions at intervals (reaction time)
         if self.decision_delay >= self.reaction_time:
             self.decision_delay = 0
-            self._make_decision(players, platform)
+            if snapshot is None:
+                snapshot = PlayerSystem()
+                snapshot.sync(players)
+            self._make_decision(snapshot, platform)
             
         # Execute current decision
         self._execute_action(dt)
         
         # Update base player physics
-        super().update(dt)
+        super().update(dt, self._fake_keys)
         
-        self.last_position = self.pos.copy()
+        self.last_position.update(self.pos)
         
-    def _make_decision(self, players, platform):
+    def _make_decision(self, snapshot, platform):
         """Main AI decision-making"""
+        # Offset to the platform center, shared by the assessment and plans
+        to_center_x = platform.center.x - self.pos.x
+        to_center_y = platform.center.y - self.pos.y
+        dist_from_center = math.hypot(to_center_x, to_center_y)
+        radius = platform.radius
+        
         # Assess situation
-        self._assess_state(players, platform)
+        self._assess_state(snapshot, dist_from_center, radius)
         
         # Choose action based on state
         if self.state == AIState.SURVIVAL:
-            self._plan_survival(platform)
+            self._plan_survival(to_center_x, to_center_y, dist_from_center)
         elif self.state == AIState.AGGRESSIVE:
-            self._plan_attack(players)
+            self._plan_attack(snapshot)
         elif self.state == AIState.DEFENSIVE:
-            self._plan_defense(players, platform)
+            self._plan_defense(snapshot, to_center_x, to_center_y,
+                               dist_from_center, radius)
         else:  # OPPORTUNISTIC
-            self._plan_opportunistic(players, platform)
+            self._plan_opportunistic(to_center_x, to_center_y,
+                                     dist_from_center, radius)
             
-    def _assess_state(self, players, platform):
+    def _enemy_distances_sq(self, snapshot):
+        """Squared distances to all players and mask of alive enemies"""
+        enemies = snapshot.alive.copy()
+        enemies[self.player_id] = False
+        return distance_sq(self.pos.x, self.pos.y, snapshot.px, snapshot.py), enemies
+        
+    def _assess_state(self, snapshot, dist_from_center, radius):
         """Assess current situation and choose state"""
         # Check distance to platform edge
-        distance_to_edge = platform.radius - (self.pos - platform.center).length()
-        health_ratio = distance_to_edge / platform.radius
+        distance_to_edge = radius - dist_from_center
+        health_ratio = distance_to_edge / radius
         
         # Count nearby threats
-        threats = 0
-        for player in players:
-            if player != self and player.alive:
-                dist = (player.pos - self.pos).length()
-                if dist < 150:
-                    threats += 1
+        dist_sq, enemies = self._enemy_distances_sq(snapshot)
+        threats = int(np.count_nonzero(enemies & (dist_sq < 150 * 150)))
                     
         # Decide state
         if health_ratio < self.danger_threshold:
@@ -113,176 +148,147 @@ class AIPlayer(Player):
         else:
             self.state = AIState.OPPORTUNISTIC
             
-    def _plan_survival(self, platform):
+    def _set_target(self, dir_x, dir_y, noise=0.0):
+        """Set normalized movement direction, optionally jittered"""
+        if noise:
+            dir_x += _jitter() * noise
+            dir_y += _jitter() * noise
+            
+        length = math.hypot(dir_x, dir_y)
+        if length > 0:
+            self.target_dir_x = dir_x / length
+            self.target_dir_y = dir_y / length
+        else:
+            self.target_dir_x = 0.0
+            self.target_dir_y = 0.0
+            
+    def _plan_survival(self, dx, dy, distance):
         """Plan survival strategy - move to center"""
         # Target platform center
-        to_center = platform.center - self.pos
-        distance = to_center.length()
-        
         if distance > 10:
-            direction = to_center.normalize()
-            
             # Add some randomness based on difficulty
             noise = (1 - self.aim_accuracy) * 50
-            direction.x += random.uniform(-noise, noise)
-            direction.y += random.uniform(-noise, noise)
-            
-            if distance > 0:
-                direction = direction.normalize()
-            
-            self.target_direction = direction
+            self._set_target(dx / distance, dy / distance, noise)
             self.should_dash = distance > 100 and self.dash_charges > 0
         else:
-            self.target_direction = pygame.math.Vector2(0, 0)
+            self._set_target(0.0, 0.0)
             self.should_dash = False
             
-    def _plan_attack(self, players):
+    def _plan_attack(self, snapshot):
         """Plan aggressive strategy - chase nearest enemy"""
+        px = self.pos.x
+        py = self.pos.y
+        
         # Find nearest enemy
         nearest = None
-        min_dist = float('inf')
-        
-        for player in players:
-            if player != self and player.alive:
-                dist = (player.pos - self.pos).length()
-                if dist < min_dist:
-                    min_dist = dist
-                    nearest = player
+        dist_sq, enemies = self._enemy_distances_sq(snapshot)
+        if enemies.any():
+            nearest = int(np.argmin(np.where(enemies, dist_sq, np.inf)))
                     
-        if nearest:
-            self.target_player = nearest
+        if nearest is not None:
+            self.target_player = snapshot.players[nearest]
             
             # Predict enemy position
-            prediction = self._predict_position(nearest)
+            target_x, target_y = self._predict_position(snapshot, nearest)
             
             # Move towards predicted position
-            to_target = prediction - self.pos
-            distance = to_target.length()
+            dx = target_x - px
+            dy = target_y - py
+            distance = math.hypot(dx, dy)
             
             if distance > 10:
-                direction = to_target.normalize()
-                
                 # Add inaccuracy
                 noise = (1 - self.aim_accuracy) * 30
-                direction.x += random.uniform(-noise, noise)
-                direction.y += random.uniform(-noise, noise)
-                
-                if distance > 0:
-                    direction = direction.normalize()
-                
-                self.target_direction = direction
+                self._set_target(dx / distance, dy / distance, noise)
                 
                 # Dash to catch up
                 self.should_dash = (distance > 80 and distance < 200 and 
                                   self.dash_charges > 0)
             else:
-                self.target_direction = pygame.math.Vector2(0, 0)
+                self._set_target(0.0, 0.0)
                 self.should_dash = False
                 
-    def _plan_defense(self, players, platform):
+    def _plan_defense(self, snapshot, to_center_x, to_center_y,
+                      dist_from_center, radius):
         """Plan defensive strategy - maintain distance"""
-        # Find center of mass of threats
-        threat_center = pygame.math.Vector2(0, 0)
-        threat_count = 0
+        px = self.pos.x
+        py = self.pos.y
         
-        for player in players:
-            if player != self and player.alive:
-                dist = (player.pos - self.pos).length()
-                if dist < 200:
-                    threat_center += player.pos
-                    threat_count += 1
+        # Find center of mass of threats
+        dist_sq, enemies = self._enemy_distances_sq(snapshot)
+        threats = enemies & (dist_sq < 200 * 200)
+        threat_count = int(np.count_nonzero(threats))
                     
         if threat_count > 0:
-            threat_center /= threat_count
+            threat_x = float(snapshot.px[threats].sum()) / threat_count
+            threat_y = float(snapshot.py[threats].sum()) / threat_count
             
             # Move away from threats but stay on platform
-            away_from_threats = self.pos - threat_center
-            to_center = platform.center - self.pos
+            if dist_from_center > 0:
+                center_dir_x = to_center_x / dist_from_center
+                center_dir_y = to_center_y / dist_from_center
+            else:
+                center_dir_x = center_dir_y = 0.0
             
             # Balance between staying on platform and avoiding threats
-            safe_direction = (away_from_threats * 0.6 + to_center.normalize() * 0.4)
-            
-            if safe_direction.length() > 0:
-                safe_direction = safe_direction.normalize()
-                
-            self.target_direction = safe_direction
+            self._set_target((px - threat_x) * 0.6 + center_dir_x * 0.4,
+                             (py - threat_y) * 0.6 + center_dir_y * 0.4)
             self.should_dash = self.dash_charges > 1  # Keep one charge for escape
         else:
-            self._plan_opportunistic(players, platform)
+            self._plan_opportunistic(to_center_x, to_center_y,
+                                     dist_from_center, radius)
             
-    def _plan_opportunistic(self, players, platform):
+    def _plan_opportunistic(self, dx, dy, distance_from_center, radius):
         """Plan opportunistic strategy - position strategically"""
         # Move to tactical position
         # Stay near center but watch for opportunities
         
-        to_center = platform.center - self.pos
-        distance_from_center = to_center.length()
-        
         # Ideal position: 30% from center
-        ideal_distance = platform.radius * 0.3
+        ideal_distance = radius * 0.3
         
         if distance_from_center > ideal_distance + 20:
             # Move toward center
-            direction = to_center.normalize()
-            self.target_direction = direction
-            self.should_dash = False
+            self._set_target(dx, dy)
         elif distance_from_center < ideal_distance - 20:
             # Move away from center slightly
-            direction = -to_center.normalize()
-            self.target_direction = direction
-            self.should_dash = False
+            self._set_target(-dx, -dy)
         else:
             # Patrol/circle
-            tangent = pygame.math.Vector2(-to_center.y, to_center.x).normalize()
-            self.target_direction = tangent
-            self.should_dash = False
-            
-    def _predict_position(self, player):
-        """Predict future position of player"""
-        if not hasattr(player, 'vel'):
-            return player.pos
+            self._set_target(-dy, dx)
+        self.should_dash = False
             
+    def _predict_position(self, snapshot, index):
+        """Predict future (x, y) position of the player at index"""
         # Predict 300ms ahead
         prediction_time = 0.3
-        predicted = player.pos + player.vel * prediction_time
-        
-        return predicted
+        return (float(snapshot.px[index] + snapshot.vx[index] * prediction_time),
+                float(snapshot.py[index] + snapshot.vy[index] * prediction_time))
         
     def _execute_action(self, dt):
         """Execute planned action using fake keyboard input"""
-        if not hasattr(self, 'target_direction'):
-            return
-            
-        # Simulate key presses
-        keys_state = {}
+        keys_state = self._fake_keys
+        dir_x = self.target_dir_x
+        dir_y = self.target_dir_y
+        moving = dir_x * dir_x + dir_y * dir_y > 0.1 * 0.1
         
         # Movement
-        if self.target_direction.length() > 0.1:
-            if self.target_direction.x > 0.3:
-                keys_state[self.controls['right']] = True
-            elif self.target_direction.x < -0.3:
-                keys_state[self.controls['left']] = True
-                
-            if self.target_direction.y > 0.3:
-                keys_state[self.controls['down']] = True
-            elif self.target_direction.y < -0.3:
-                keys_state[self.controls['up']] = True
+        keys_state[self._key_right] = moving and dir_x > 0.3
+        keys_state[self._key_left] = moving and dir_x < -0.3
+        keys_state[self._key_down] = moving and dir_y > 0.3
+        keys_state[self._key_up] = moving and dir_y < -0.3
                 
         # Dash
-        if hasattr(self, 'should_dash') and self.should_dash:
-            keys_state[self.controls['dash']] = True
-            
-        # Override pygame.key.get_pressed for this AI
-        self._fake_keys = keys_state
+        keys_state[self._key_dash] = self.should_dash
         
     def get_keys(self):
         """Get simulated key state"""
-        return getattr(self, '_fake_keys', {})
+        return self._fake_keys
 
 class AIManager:
     """Manages AI players"""
     def __init__(self):
         self.ai_players = []
+        self.snapshot = PlayerSystem()
         
     def add_ai(self, player):
         """Register an AI player"""
@@ -291,14 +297,15 @@ class AIManager:
             
     def update(self, dt, all_players, platform):
         """Update all AI players"""
+        if not self.ai_players:
+            return
+            
+        self.snapshot.sync(all_players)
+        
         for ai in self.ai_players:
             if ai.alive:
-                # Override key reading
-                original_get_pressed = pygame.key.get_pressed
-                pygame.key.get_pressed = lambda: ai.get_keys()
-                
-                # Update AI logic
-                ai.update(dt, all_players, platform)
+                ai.update(dt, all_players, platform, self.snapshot)
                 
-                # Restore original function
-                pygame.key.get_pressed = original_get_pressed
\ No newline at end of file
+    def clear(self):
+        """Forget all registered AI players"""
+        self.ai_players.clear()
\ No newline at end of file
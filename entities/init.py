@@ -3,5 +3,6 @@ Game entities package
 """
 from entities.player import Player
 from entities.platform import Platform
+from entities.player_system import PlayerSystem
 
-__all__ = ['Player', 'Platform']
+__all__ = ['Player', 'Platform', 'PlayerSystem']
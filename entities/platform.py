@@ -6,7 +6,6 @@ from config.settings import (
     SCREEN_WIDTH, SCREEN_HEIGHT, PLATFORM_START_RADIUS,
     PLATFORM_MIN_RADIUS, SHRINK_RATE, COLORS
 )
-from core.physics import circle_contains_point
 
 class Platform:
     """Shrinking circular platform"""
@@ -24,10 +23,10 @@ class Platform:
             
     def contains_point(self, point):
         """Check if a point is inside the platform"""
-        return circle_contains_point(
-            self.center.x, self.center.y, self.radius,
-            point.x, point.y
-        )
+        # Inlined circle_contains_point - called for every player each frame
+        dx = point.x - self.center.x
+        dy = point.y - self.center.y
+        return dx * dx + dy * dy <= self.radius * self.radius
         
     def render(self, screen, offset_x=0, offset_y=0):
         """Draw platform"""
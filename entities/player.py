@@ -1,7 +1,7 @@
 """
 Enhanced player entity with more abilities and visual effects
-DEBUGGED VERSION - Added extensive debugging
 """
+import logging
 import pygame
 import math
 from config.settings import (
@@ -9,37 +9,80 @@ from config.settings import (
     PLAYER_DASH_DURATION, PLAYER_DASH_COOLDOWN, FRICTION,
     SCREEN_WIDTH, SCREEN_HEIGHT
 )
+from core.utils import quantize_alpha
+
+log = logging.getLogger("player")
 
 class Player:
     """Enhanced player character with more abilities"""
+    # Pre-rendered translucent circles for the trail and dash glow,
+    # keyed by (color, radius, alpha)
+    _glow_cache = {}
+    
+    # Rendered player-number labels, keyed by player_id
+    _font = None
+    _number_cache = {}
+    
+    @classmethod
+    def _glow_surface(cls, color, radius, alpha):
+        """Get (building once) a cached SRCALPHA circle surface"""
+        key = (color, radius, alpha)
+        surf = cls._glow_cache.get(key)
+        if surf is None:
+            surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surf, (*color, alpha), (radius, radius), radius)
+            surf = surf.convert_alpha()
+            cls._glow_cache[key] = surf
+        return surf
+        
+    @classmethod
+    def _number_surface(cls, player_id):
+        """Get (rendering once) the label showing a player's number"""
+        surf = cls._number_cache.get(player_id)
+        if surf is None:
+            if cls._font is None:
+                cls._font = pygame.font.Font(None, 16)
+            surf = cls._font.render(str(player_id + 1), True, (255, 255, 255))
+            cls._number_cache[player_id] = surf
+        return surf
+        
     def __init__(self, x, y, color, player_id, controls):
         self.pos = pygame.math.Vector2(x, y)
         self.vel = pygame.math.Vector2(0, 0)
-        self.color = color
+        if len(color) not in (3, 4):
+            raise ValueError(f"Player color must be an RGB(A) tuple, got {color!r}")
+        self.color = tuple(color)
         self.player_id = player_id
         self.controls = controls
+        
+        # Key codes resolved once instead of per-frame dict lookups
+        self._key_up = controls['up']
+        self._key_down = controls['down']
+        self._key_left = controls['left']
+        self._key_right = controls['right']
+        self._key_dash = controls['dash']
         self.radius = PLAYER_RADIUS
         self.alive = True
+        self.is_ai = False
         
-        # DEBUG: Print initialization
-        print(f"🎮 Player {player_id} initialized:")
-        print(f"   Position: ({x:.1f}, {y:.1f})")
-        print(f"   Color: {color}")
-        print(f"   Radius: {self.radius}")
-        print(f"   Alive: {self.alive}")
-        print(f"   Controls: {controls}")
+        log.debug("Player %d initialized at (%.1f, %.1f)", player_id, x, y)
         
         # Dash mechanics
         self.is_dashing = False
         self.dash_time = 0
         self.dash_cooldown = 0
-        self.dash_direction = pygame.math.Vector2(0, 0)
+        self.dash_dx = 0.0
+        self.dash_dy = 0.0
         self.dash_charges = 1
         self.max_dash_charges = 2
         
         # Visual effects
-        self.trail_points = []
+        # Trail: fixed-size ring buffer of recent positions
         self.max_trail_length = 10
+        self.trail_x = [0.0] * self.max_trail_length
+        self.trail_y = [0.0] * self.max_trail_length
+        self.trail_head = 0  # next slot to write
+        self.trail_count = 0
         self.glow_pulse = 0
         
         # Stats
@@ -50,11 +93,11 @@ class Player:
         self.buffered_dash = False
         self.buffer_time = 0
         
-        # DEBUG: Frame counter for render debugging
-        self.render_count = 0
+    def update(self, dt, keys=None):
+        """Update player state
         
-    def update(self, dt):
-        """Update player state"""
+        keys: key state indexable by key code; defaults to the keyboard.
+        """
         if not self.alive:
             return
             
@@ -76,6 +119,10 @@ class Player:
         # Update glow pulse
         self.glow_pulse += dt * 0.005
         
+        # Kinematics run on plain floats, written back to the Vector2s once
+        vx = self.vel.x
+        vy = self.vel.y
+        
         # Handle dashing
         if self.is_dashing:
             self.dash_time += dt
@@ -84,21 +131,22 @@ class Player:
                 self.dash_time = 0
             else:
                 # Apply dash velocity with slight control
-                dash_vel = self.dash_direction * PLAYER_DASH_SPEED
-                self.vel = self.vel * 0.1 + dash_vel * 0.9
+                vx = vx * 0.1 + self.dash_dx * PLAYER_DASH_SPEED * 0.9
+                vy = vy * 0.1 + self.dash_dy * PLAYER_DASH_SPEED * 0.9
         else:
             # Normal movement
-            keys = pygame.key.get_pressed()
+            if keys is None:
+                keys = pygame.key.get_pressed()
             move_x = 0
             move_y = 0
             
-            if keys[self.controls['up']]:
+            if keys[self._key_up]:
                 move_y -= 1
-            if keys[self.controls['down']]:
+            if keys[self._key_down]:
                 move_y += 1
-            if keys[self.controls['left']]:
+            if keys[self._key_left]:
                 move_x -= 1
-            if keys[self.controls['right']]:
+            if keys[self._key_right]:
                 move_x += 1
                 
             # Normalize diagonal movement
@@ -111,11 +159,11 @@ class Player:
             target_vel_y = move_y * PLAYER_SPEED
             
             accel = 15 * dt_sec
-            self.vel.x += (target_vel_x - self.vel.x) * accel
-            self.vel.y += (target_vel_y - self.vel.y) * accel
+            vx += (target_vel_x - vx) * accel
+            vy += (target_vel_y - vy) * accel
             
             # Check for dash input
-            if keys[self.controls['dash']]:
+            if keys[self._key_dash]:
                 if self.dash_charges > 0 and not self.buffered_dash:
                     if move_x != 0 or move_y != 0:
                         self.start_dash(move_x, move_y)
@@ -130,25 +178,42 @@ class Player:
                 self.buffered_dash = False
                 
         # Apply friction
-        self.vel *= FRICTION
+        vx *= FRICTION
+        vy *= FRICTION
         
         # Clamp velocity
         max_vel = 800
-        if self.vel.length() > max_vel:
-            self.vel.scale_to_length(max_vel)
+        speed_sq = vx * vx + vy * vy
+        if speed_sq > max_vel * max_vel:
+            scale = max_vel / math.sqrt(speed_sq)
+            vx *= scale
+            vy *= scale
         
         # Update position
-        self.pos += self.vel * dt_sec
+        px = self.pos.x + vx * dt_sec
+        py = self.pos.y + vy * dt_sec
         
         # Keep in bounds (with buffer)
         buffer = 50
-        self.pos.x = max(-buffer, min(SCREEN_WIDTH + buffer, self.pos.x))
-        self.pos.y = max(-buffer, min(SCREEN_HEIGHT + buffer, self.pos.y))
+        if px < -buffer:
+            px = -buffer
+        elif px > SCREEN_WIDTH + buffer:
+            px = SCREEN_WIDTH + buffer
+        if py < -buffer:
+            py = -buffer
+        elif py > SCREEN_HEIGHT + buffer:
+            py = SCREEN_HEIGHT + buffer
+        
+        self.vel.update(vx, vy)
+        self.pos.update(px, py)
         
         # Update trail
-        self.trail_points.append(self.pos.copy())
-        if len(self.trail_points) > self.max_trail_length:
-            self.trail_points.pop(0)
+        head = self.trail_head
+        self.trail_x[head] = px
+        self.trail_y[head] = py
+        self.trail_head = (head + 1) % self.max_trail_length
+        if self.trail_count < self.max_trail_length:
+            self.trail_count += 1
         
     def start_dash(self, dir_x, dir_y):
         """Start a dash"""
@@ -162,17 +227,20 @@ class Player:
         if self.dash_charges == 0:
             self.dash_cooldown = PLAYER_DASH_COOLDOWN
             
-        self.dash_direction = pygame.math.Vector2(dir_x, dir_y).normalize()
+        # Movement input is already unit length (diagonals are scaled by 0.707)
+        self.dash_dx = dir_x
+        self.dash_dy = dir_y
         
     def eliminate(self):
         """Eliminate this player"""
-        print(f"💀 Player {self.player_id} eliminated at ({self.pos.x:.1f}, {self.pos.y:.1f})")
+        log.debug("Player %d eliminated at (%.1f, %.1f)",
+                  self.player_id, self.pos.x, self.pos.y)
         self.alive = False
         self.deaths += 1
         
     def respawn(self, x, y):
         """Respawn player"""
-        print(f"🔄 Player {self.player_id} respawning at ({x:.1f}, {y:.1f})")
+        log.debug("Player %d respawning at (%.1f, %.1f)", self.player_id, x, y)
         self.pos.x = x
         self.pos.y = y
         self.vel.x = 0
@@ -180,120 +248,88 @@ class Player:
         self.alive = True
         self.dash_charges = self.max_dash_charges
         self.dash_cooldown = 0
-        self.trail_points.clear()
+        self.trail_head = 0
+        self.trail_count = 0
         
     def render(self, screen, offset_x=0, offset_y=0):
         """Draw player with enhanced visuals"""
-        # DEBUG: Print render call info every 60 frames
-        self.render_count += 1
-        if self.render_count % 60 == 0:
-            print(f"🎨 Rendering Player {self.player_id}:")
-            print(f"   Alive: {self.alive}")
-            print(f"   Position: ({self.pos.x:.1f}, {self.pos.y:.1f})")
-            print(f"   Screen pos: ({int(self.pos.x + offset_x)}, {int(self.pos.y + offset_y)})")
-            print(f"   Offset: ({offset_x:.1f}, {offset_y:.1f})")
-            print(f"   Radius: {self.radius}")
-            print(f"   Color: {self.color}")
-        
         if not self.alive:
-            if self.render_count % 60 == 0:
-                print(f"   ⚠️ Skipping render - player is dead")
             return
         
         # Calculate screen position
         x = int(self.pos.x + offset_x)
         y = int(self.pos.y + offset_y)
         
-        # DEBUG: Check if position is on screen
-        screen_rect = screen.get_rect()
-        if self.render_count % 60 == 0:
-            on_screen = screen_rect.collidepoint(x, y)
-            print(f"   On screen: {on_screen} (Screen size: {screen.get_width()}x{screen.get_height()})")
+        # Skip everything when the player and its glow are fully off-screen
+        screen_w, screen_h = screen.get_size()
+        margin = self.radius + 16
+        if x + margin < 0 or y + margin < 0 or x - margin >= screen_w or y - margin >= screen_h:
+            return
         
         # Draw trail
-        if len(self.trail_points) > 1 and self.is_dashing:
-            for i, point in enumerate(self.trail_points):
-                alpha = int(255 * (i / len(self.trail_points)))
-                trail_radius = int(self.radius * (i / len(self.trail_points)))
+        count = self.trail_count
+        if count > 1 and self.is_dashing:
+            size = self.max_trail_length
+            start = self.trail_head - count  # oldest point first
+            trail_x = self.trail_x
+            trail_y = self.trail_y
+            blits = []
+            for i in range(count):
+                j = (start + i) % size
+                alpha = int(255 * (i / count))
+                trail_radius = int(self.radius * (i / count))
                 if trail_radius > 0:
-                    try:
-                        trail_surf = pygame.Surface((trail_radius * 2, trail_radius * 2), pygame.SRCALPHA)
-                        pygame.draw.circle(trail_surf, (*self.color, alpha // 2), 
-                                         (trail_radius, trail_radius), trail_radius)
-                        screen.blit(trail_surf, 
-                                  (int(point.x + offset_x - trail_radius), 
-                                   int(point.y + offset_y - trail_radius)))
-                    except Exception as e:
-                        print(f"⚠️ Trail render error: {e}")
+                    trail_surf = self._glow_surface(self.color, trail_radius, alpha // 2)
+                    blits.append((trail_surf,
+                                  (int(trail_x[j] + offset_x - trail_radius), 
+                                   int(trail_y[j] + offset_y - trail_radius))))
+            screen.fblits(blits)
         
         # Draw glow when dashing
         if self.is_dashing:
-            try:
-                glow_radius = self.radius + 8
-                glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-                pulse = abs(math.sin(self.glow_pulse))
-                glow_alpha = int(100 + pulse * 100)
-                pygame.draw.circle(glow_surf, (*self.color, glow_alpha), 
-                                 (glow_radius, glow_radius), glow_radius)
-                screen.blit(glow_surf, (x - glow_radius, y - glow_radius))
-            except Exception as e:
-                print(f"⚠️ Glow render error: {e}")
+            glow_radius = self.radius + 8
+            pulse = abs(math.sin(self.glow_pulse))
+            glow_alpha = quantize_alpha(int(100 + pulse * 100))
+            glow_surf = self._glow_surface(self.color, glow_radius, glow_alpha)
+            screen.blit(glow_surf, (x - glow_radius, y - glow_radius))
         
-        # Draw player circle with border (MAIN PLAYER RENDER)
-        try:
-            # White border
-            pygame.draw.circle(screen, (255, 255, 255), (x, y), self.radius + 2)
-            # Main colored circle
-            pygame.draw.circle(screen, self.color, (x, y), self.radius)
-            
-            if self.render_count % 60 == 0:
-                print(f"   ✅ Main circles drawn successfully")
-                
-        except Exception as e:
-            print(f"❌ ERROR drawing main player circle: {e}")
-            print(f"   Screen: {screen}")
-            print(f"   Position: ({x}, {y})")
-            print(f"   Radius: {self.radius}")
-            print(f"   Color: {self.color}")
+        # Draw player circle with border
+        # White border
+        pygame.draw.circle(screen, (255, 255, 255), (x, y), self.radius + 2)
+        # Main colored circle
+        pygame.draw.circle(screen, self.color, (x, y), self.radius)
         
         # Draw direction indicator
-        if self.vel.length() > 50:
-            try:
-                angle = math.atan2(self.vel.y, self.vel.x)
-                end_x = x + int(math.cos(angle) * (self.radius + 5))
-                end_y = y + int(math.sin(angle) * (self.radius + 5))
-                pygame.draw.line(screen, (255, 255, 255), (x, y), (end_x, end_y), 3)
-            except Exception as e:
-                print(f"⚠️ Direction indicator error: {e}")
+        vx = self.vel.x
+        vy = self.vel.y
+        speed_sq = vx * vx + vy * vy
+        if speed_sq > 50 * 50:
+            scale = (self.radius + 5) / math.sqrt(speed_sq)
+            end_x = x + int(vx * scale)
+            end_y = y + int(vy * scale)
+            pygame.draw.line(screen, (255, 255, 255), (x, y), (end_x, end_y), 3)
         
         # Draw dash charges
-        try:
-            charge_radius = 3
-            charge_spacing = 8
-            start_x = x - (self.max_dash_charges - 1) * charge_spacing // 2
-            for i in range(self.max_dash_charges):
-                charge_x = start_x + i * charge_spacing
-                charge_y = y + self.radius + 8
-                
-                if i < self.dash_charges:
-                    color = (100, 255, 100)
+        charge_radius = 3
+        charge_spacing = 8
+        start_x = x - (self.max_dash_charges - 1) * charge_spacing // 2
+        for i in range(self.max_dash_charges):
+            charge_x = start_x + i * charge_spacing
+            charge_y = y + self.radius + 8
+            
+            if i < self.dash_charges:
+                color = (100, 255, 100)
+            else:
+                # Show cooldown progress
+                if i == self.dash_charges and self.dash_cooldown > 0:
+                    progress = 1 - (self.dash_cooldown / PLAYER_DASH_COOLDOWN)
+                    color = (50 + int(155 * progress), 100, 100)
                 else:
-                    # Show cooldown progress
-                    if i == self.dash_charges and self.dash_cooldown > 0:
-                        progress = 1 - (self.dash_cooldown / PLAYER_DASH_COOLDOWN)
-                        color = (50 + int(155 * progress), 100, 100)
-                    else:
-                        color = (50, 50, 50)
-                        
-                pygame.draw.circle(screen, color, (charge_x, charge_y), charge_radius)
-        except Exception as e:
-            print(f"⚠️ Dash charges render error: {e}")
+                    color = (50, 50, 50)
+                    
+            pygame.draw.circle(screen, color, (charge_x, charge_y), charge_radius)
         
         # Draw player number
-        try:
-            font = pygame.font.Font(None, 16)
-            num_text = font.render(str(self.player_id + 1), True, (255, 255, 255))
-            num_rect = num_text.get_rect(center=(x, y))
-            screen.blit(num_text, num_rect)
-        except Exception as e:
-            print(f"⚠️ Player number render error: {e}")
\ No newline at end of file
+        num_text = self._number_surface(self.player_id)
+        num_rect = num_text.get_rect(center=(x, y))
+        screen.blit(num_text, num_rect)
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""
+Structure-of-arrays view of player state
+"""
+import numpy as np
+from config.settings import PLAYER_COUNT
+
+class PlayerSystem:
+    """Player state as contiguous columns indexed by player_id
+
+    Player objects stay authoritative; sync() gathers their state once so
+    per-frame queries over all players run as vector ops instead of
+    attribute walks over scattered objects.
+    """
+    def __init__(self, capacity=PLAYER_COUNT):
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        self.px = np.zeros(capacity)
+        self.py = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.radius = np.zeros(capacity)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.players = [None] * capacity
+
+    def sync(self, players):
+        """Copy current player state into the columns"""
+        capacity = max((p.player_id for p in players), default=-1) + 1
+        if capacity > len(self.px):
+            self._allocate(capacity)
+
+        px, py, vx, vy = self.px, self.py, self.vx, self.vy
+        radius, alive = self.radius, self.alive
+        alive.fill(False)
+        for player in players:
+            i = player.player_id
+            pos = player.pos
+            vel = player.vel
+            px[i] = pos.x
+            py[i] = pos.y
+            vx[i] = vel.x
+            vy[i] = vel.y
+            radius[i] = player.radius
+            alive[i] = player.alive
+            self.players[i] = player
\ No newline at end of file
@@ -4,6 +4,7 @@ Power-up and special abilities system
 import pygame
 import random
 import math
+from core.utils import distance_sq, quantize_alpha
 
 class PowerUpType:
     """Power-up types enumeration"""
@@ -18,6 +19,10 @@ class PowerUpType:
 
 class PowerUp:
     """Power-up pickup entity"""
+    # Pre-rendered sprites (glow, body, border and symbol), keyed by
+    # (type, color, radius, glow alpha)
+    _sprite_cache = {}
+    
     def __init__(self, x, y, powerup_type):
         self.pos = pygame.math.Vector2(x, y)
         self.type = powerup_type
@@ -63,14 +68,18 @@ class PowerUp:
         if not self.active:
             return False
             
-        distance = (player.pos - self.pos).length()
-        return distance < (self.radius + player.radius)
+        reach = self.radius + player.radius
+        return distance_sq(self.pos.x, self.pos.y, player.pos.x, player.pos.y) < reach * reach
         
     def render(self, screen, offset_x=0, offset_y=0):
         """Render power-up"""
         if not self.active:
             return
             
+        screen.blit(*self.get_blit(offset_x, offset_y))
+        
+    def get_blit(self, offset_x=0, offset_y=0):
+        """Get the (sprite, top-left) pair that draws this power-up"""
         x = int(self.pos.x + offset_x)
         y = int(self.pos.y + offset_y + self.float_offset)
         
@@ -80,19 +89,32 @@ class PowerUp:
             pulse = abs(math.sin(self.age * 0.01))
             alpha = int(100 + pulse * 155)
             
-        # Draw outer glow
         glow_radius = self.radius + 5
-        glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surf, (*self.color, alpha // 3), 
-                         (glow_radius, glow_radius), glow_radius)
-        screen.blit(glow_surf, (x - glow_radius, y - glow_radius))
-        
-        # Draw main circle with rotating symbol
-        pygame.draw.circle(screen, (*self.color, alpha), (x, y), self.radius)
-        pygame.draw.circle(screen, (255, 255, 255), (x, y), self.radius, 2)
-        
-        # Draw type indicator
-        self._draw_symbol(screen, x, y, alpha)
+        glow_alpha = quantize_alpha(alpha // 3)
+        return self._sprite(glow_alpha), (x - glow_radius, y - glow_radius)
+        
+    def _sprite(self, glow_alpha):
+        """Get (building once) the sprite for this type and glow alpha"""
+        key = (self.type, self.color, self.radius, glow_alpha)
+        sprite = self._sprite_cache.get(key)
+        if sprite is None:
+            glow_radius = self.radius + 5
+            center = (glow_radius, glow_radius)
+            sprite = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+            
+            # Outer glow
+            pygame.draw.circle(sprite, (*self.color, glow_alpha), center, glow_radius)
+            
+            # Main circle with border
+            pygame.draw.circle(sprite, self.color, center, self.radius)
+            pygame.draw.circle(sprite, (255, 255, 255), center, self.radius, 2)
+            
+            # Type indicator
+            self._draw_symbol(sprite, glow_radius, glow_radius, 255)
+            
+            sprite = sprite.convert_alpha()
+            self._sprite_cache[key] = sprite
+        return sprite
         
     def _draw_symbol(self, screen, x, y, alpha):
         """Draw power-up type symbol"""
@@ -125,6 +147,16 @@ class PowerUp:
 
 class PowerUpEffect:
     """Active power-up effect on player"""
+    # Modifiers per type: (speed multiplier, size multiplier, shield, bonus dash charges)
+    _EFFECTS = {
+        PowerUpType.SPEED_BOOST: (1.5, 1.0, False, 0),
+        PowerUpType.SIZE_UP: (1.0, 1.5, False, 0),
+        PowerUpType.SIZE_DOWN: (1.0, 0.6, False, 0),
+        PowerUpType.SHIELD: (1.0, 1.0, True, 0),
+        PowerUpType.TRIPLE_DASH: (1.0, 1.0, False, 2),
+    }
+    _NO_EFFECT = (1.0, 1.0, False, 0)
+    
     def __init__(self, powerup_type, duration=5000):
         self.type = powerup_type
         self.duration = duration
@@ -132,26 +164,8 @@ class PowerUpEffect:
         self.active = True
         
         # Effect modifiers
-        self.speed_multiplier = 1.0
-        self.size_multiplier = 1.0
-        self.has_shield = False
-        self.dash_charges_bonus = 0
-        
-        # Apply effect
-        self._apply_effect()
-        
-    def _apply_effect(self):
-        """Apply power-up effect"""
-        if self.type == PowerUpType.SPEED_BOOST:
-            self.speed_multiplier = 1.5
-        elif self.type == PowerUpType.SIZE_UP:
-            self.size_multiplier = 1.5
-        elif self.type == PowerUpType.SIZE_DOWN:
-            self.size_multiplier = 0.6
-        elif self.type == PowerUpType.SHIELD:
-            self.has_shield = True
-        elif self.type == PowerUpType.TRIPLE_DASH:
-            self.dash_charges_bonus = 2
+        (self.speed_multiplier, self.size_multiplier,
+         self.has_shield, self.dash_charges_bonus) = self._EFFECTS.get(powerup_type, self._NO_EFFECT)
             
     def update(self, dt):
         """Update effect"""
@@ -203,12 +217,17 @@ class PowerUpManager:
             if len(self.powerups) < 3:  # Max 3 at once
                 self.spawn_random(platform)
                 
-        # Update existing power-ups
-        self.powerups = [p for p in self.powerups if p.update(dt)]
+        # Update existing power-ups, rebuilding the list only on expiry
+        expired = False
+        for powerup in self.powerups:
+            if not powerup.update(dt):
+                expired = True
+        if expired:
+            self.powerups = [p for p in self.powerups if p.active]
         
     def check_pickups(self, player):
         """Check if player picked up any power-ups"""
-        for powerup in self.powerups[:]:
+        for powerup in self.powerups:
             if powerup.check_pickup(player):
                 self.powerups.remove(powerup)
                 return powerup.type
@@ -216,8 +235,7 @@ class PowerUpManager:
         
     def render(self, screen, offset_x=0, offset_y=0):
         """Render all power-ups"""
-        for powerup in self.powerups:
-            powerup.render(screen, offset_x, offset_y)
+        screen.fblits([p.get_blit(offset_x, offset_y) for p in self.powerups if p.active])
             
     def clear(self):
         """Clear all power-ups"""
@@ -22,17 +22,29 @@ def main():
     scene_manager.add_scene('results', results_scene)
     scene_manager.change_scene('menu')
     
+    # Bind loop callables once instead of resolving them every frame
+    tick = clock.tick
+    poll = pygame.event.poll
+    flip = pygame.display.flip
+    handle_event = scene_manager.handle_event
+    update = scene_manager.update
+    render = scene_manager.render
+    QUIT = pygame.QUIT
+    NOEVENT = pygame.NOEVENT
+    
     running = True
     while running:
-        dt = clock.tick(FPS)
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        dt = tick(FPS)
+        event = poll()
+        while event.type != NOEVENT:
+            if event.type == QUIT:
                 running = False
             else:
-                scene_manager.handle_event(event)
-        scene_manager.update(dt)
-        scene_manager.render(screen)
-        pygame.display.flip()
+                handle_event(event)
+            event = poll()
+        update(dt)
+        render(screen)
+        flip()
     
     pygame.quit()
     sys.exit()
@@ -3,7 +3,8 @@ CROWD CONTROL V3.0 - Master Integration
 Enhanced game scene with ALL new features - FIXED RENDERING
 """
 import pygame
-import random
+import math
+import numpy as np
 from scenes.scene_manager import Scene
 from config.settings import (
     SCREEN_WIDTH, SCREEN_HEIGHT, COLORS, PLAYER_COLORS,
@@ -17,11 +18,24 @@ from entities.powerup import PowerUpManager, PowerUpEffect, PowerUpType
 from systems.particles import ParticleSystem
 from systems.screenshake import ScreenShake
 from systems.sound import SoundManager
+from systems.settings import GameSettings
 from systems.vfx import VFXManager, TrailRenderer, ImpactEffect
-from systems.replay import ReplayRecorder
+from systems.replay import ReplayRecorder, STATE_FIELDS
 from ui.hud import AdvancedHUD
 from ui.transitions import FadeTransition
-from core.physics import check_collision, resolve_collision, SpatialGrid
+from core.physics import (
+    resolve_collisions, find_colliding_pairs, find_colliding_pairs_scalar,
+    SpatialGrid
+)
+
+# Up to this many alive players a plain loop beats the numpy call overhead
+SCALAR_MAX_PLAYERS = 16
+
+# Up to this many alive players the vectorized all-pairs check is used and
+# the spatial grid is skipped entirely. It measured faster than the grid up to
+# at least 768 players; the cap only bounds the size of its N x N temporaries
+# (a 256 x 256 float32 matrix is 256 KB)
+BRUTE_FORCE_MAX_PLAYERS = 256
 
 class GameScene(Scene):
     """Enhanced gameplay scene with ALL V3.0 features"""
@@ -38,8 +52,13 @@ class GameScene(Scene):
         self.sound_manager = SoundManager()
         self.hud = AdvancedHUD()
         self.spatial_grid = SpatialGrid()
+        self._pos_xy = np.empty((0, 2), dtype=np.float32)
+        self._radii = np.empty(0, dtype=np.float32)
+        self._replay_state = np.zeros((0, len(STATE_FIELDS)), dtype=np.float32)
+        self._replay_colors = []
         
         # NEW V3.0 Systems
+        self.settings = GameSettings()  # loaded from disk once
         self.vfx_manager = VFXManager(SCREEN_WIDTH, SCREEN_HEIGHT)
         self.trail_renderer = TrailRenderer()
         self.impact_effects = ImpactEffect()
@@ -55,8 +74,7 @@ class GameScene(Scene):
         self.countdown = 3
         self.countdown_time = 0
         self.game_started = False
-        self.shrink_warned = False
-        self.last_shrink_warning = 0
+        self.next_shrink_warning = SHRINK_START_TIME - 3000
         
         # Recording
         self.is_recording = False
@@ -64,8 +82,50 @@ class GameScene(Scene):
         # VFX toggle (set to False to disable VFX if causing issues)
         self.enable_vfx = False  # Changed to False for stability
         
+        # Fonts and static labels, created once
+        self.font_countdown = pygame.font.Font(None, 200)
+        self.font_fight = pygame.font.Font(None, 120)
+        self.font_large = pygame.font.Font(None, 100)
+        self.font_medium = pygame.font.Font(None, 40)
+        self.font_small = pygame.font.Font(None, 28)
+        self.font_rec = pygame.font.Font(None, 24)
+        self.font_status = pygame.font.Font(None, 20)
+        
+        self.rec_text = self.font_rec.render("● REC", True, (255, 0, 0))
+        self.vfx_texts = {
+            enabled: self.font_status.render(
+                f"VFX: {'ON' if enabled else 'OFF'} (V to toggle)", True, (150, 150, 150))
+            for enabled in (True, False)
+        }
+        self.countdown_texts = {
+            n: self._compose_glow_text(
+                self.font_countdown.render(str(n), True, COLORS['HIGHLIGHT']))
+            for n in (1, 2, 3)
+        }
+        self.fight_text = self.font_fight.render("FIGHT!", True, (255, 100, 100))
+        
+        # Game over texts are built once in _end_round
+        self.game_over_inst = self.font_medium.render(
+            "R: Restart | ESC: Menu | F1: Save Replay | M: Sound | V: VFX",
+            True, COLORS['TEXT'])
+        self.game_over_blits = []
+        
+    @staticmethod
+    def _compose_glow_text(text, spread=3):
+        """Bake the four diagonal glow copies and the text into one sprite"""
+        width, height = text.get_size()
+        sprite = pygame.Surface((width + spread * 2, height + spread * 2), 
+                                pygame.SRCALPHA)
+        for offset in [(spread, spread), (-spread, -spread), 
+                       (spread, -spread), (-spread, spread)]:
+            sprite.blit(text, (spread + offset[0], spread + offset[1]))
+        sprite.blit(text, (spread, spread))
+        return sprite
+        
     def on_enter(self):
         """Start new round"""
+        # Pick up a vfx_quality changed in the settings since the last game
+        self.vfx_manager.set_quality(self.settings.get('gameplay', 'vfx_quality'))
         self._setup_round()
         
     def _setup_round(self):
@@ -76,7 +136,7 @@ class GameScene(Scene):
         self.countdown = 3
         self.countdown_time = 0
         self.game_started = False
-        self.shrink_warned = False
+        self.next_shrink_warning = SHRINK_START_TIME - 3000
         
         # Create platform
         self.platform = Platform()
@@ -89,18 +149,21 @@ class GameScene(Scene):
         # Human players
         for i in range(self.player_count):
             angle = i * angle_step
-            x = SCREEN_WIDTH // 2 + spawn_radius * pygame.math.Vector2(1, 0).rotate(angle).x
-            y = SCREEN_HEIGHT // 2 + spawn_radius * pygame.math.Vector2(1, 0).rotate(angle).y
+            rad = math.radians(angle)
+            x = SCREEN_WIDTH // 2 + spawn_radius * math.cos(rad)
+            y = SCREEN_HEIGHT // 2 + spawn_radius * math.sin(rad)
             
             player = Player(x, y, PLAYER_COLORS[i], i, PLAYER_CONTROLS[i])
             self.players.append(player)
             
         # AI players
+        self.ai_manager.clear()
         for i in range(self.ai_count):
             idx = self.player_count + i
             angle = idx * angle_step
-            x = SCREEN_WIDTH // 2 + spawn_radius * pygame.math.Vector2(1, 0).rotate(angle).x
-            y = SCREEN_HEIGHT // 2 + spawn_radius * pygame.math.Vector2(1, 0).rotate(angle).y
+            rad = math.radians(angle)
+            x = SCREEN_WIDTH // 2 + spawn_radius * math.cos(rad)
+            y = SCREEN_HEIGHT // 2 + spawn_radius * math.sin(rad)
             
             ai_player = AIPlayer(x, y, PLAYER_COLORS[idx], idx, 
                                PLAYER_CONTROLS[idx % len(PLAYER_CONTROLS)], 
@@ -108,6 +171,12 @@ class GameScene(Scene):
             self.players.append(ai_player)
             self.ai_manager.add_ai(ai_player)
             
+        self._allocate_broad_phase()
+        
+        # Replay capture buffer (see systems.replay.STATE_FIELDS)
+        self._replay_state = np.zeros((len(self.players), len(STATE_FIELDS)), dtype=np.float32)
+        self._replay_colors = [p.color for p in self.players]
+            
         # Reset systems
         self.particles.clear()
         self.screen_shake.reset()
@@ -169,17 +238,15 @@ class GameScene(Scene):
             
         self.round_time += dt
         
-        # Platform shrink warnings
-        if self.round_time > SHRINK_START_TIME - 3000 and not self.shrink_warned:
-            self.shrink_warned = True
+        # Platform shrink warnings: 3s ahead, at the start, then every 5s
+        if self.round_time > self.next_shrink_warning:
             self.sound_manager.play_platform_shrink()
-            if self.enable_vfx:
-                self.vfx_manager.add_distortion(0.5, 1000)
-            
-        if self.round_time > SHRINK_START_TIME:
-            if self.round_time - self.last_shrink_warning > 5000:
-                self.last_shrink_warning = self.round_time
-                self.sound_manager.play_platform_shrink()
+            if self.next_shrink_warning < SHRINK_START_TIME:
+                self.next_shrink_warning = SHRINK_START_TIME
+                if self.enable_vfx:
+                    self.vfx_manager.add_distortion(0.5, 1000)
+            else:
+                self.next_shrink_warning += 5000
                 
         # Update platform
         if self.round_time > SHRINK_START_TIME:
@@ -191,75 +258,63 @@ class GameScene(Scene):
         # Update power-ups
         self.powerup_manager.update(dt, self.platform)
         
-        # Update spatial grid
-        self.spatial_grid.clear()
+        # Update players (keyboard state is snapshotted once for all of them)
+        keys = pygame.key.get_pressed()
+        
+        # Advance screen shake once per frame (slowed time during hitstop)
+        actual_dt = self.screen_shake.update(dt)
+        
+        # Bound methods hoisted out of the per-player loop
+        check_pickups = self.powerup_manager.check_pickups
+        contains_point = self.platform.contains_point
+        emit_trail = self.particles.emit_trail
+        add_trail = self.trail_renderer.add_trail
         
-        # Update players
         alive_players = []
         for player in self.players:
             if player.alive:
-                actual_dt = self.screen_shake.update(dt)
-                player.update(actual_dt)
+                if not player.is_ai:  # AI players are driven by the AI manager
+                    player.update(actual_dt, keys)
+                
+                pos = player.pos
                 
                 # Check power-up pickup
-                powerup_type = self.powerup_manager.check_pickups(player)
+                powerup_type = check_pickups(player)
                 if powerup_type:
                     self._apply_powerup(player, powerup_type)
                     self.sound_manager.play_menu_select()
-                    self.particles.emit_sparkle(player.pos.x, player.pos.y, player.color)
+                    self.particles.emit_sparkle(pos.x, pos.y, player.color)
                 
                 # Check platform collision
-                if not self.platform.contains_point(player.pos):
+                if not contains_point(pos):
                     player.eliminate()
                     self._on_player_eliminated(player)
                 else:
                     alive_players.append(player)
-                    self.spatial_grid.insert(player)
                     
                 # Trail effects
-                if player.is_dashing and player.vel.length() > 100:
-                    self.particles.emit_trail(player.pos.x, player.pos.y,
-                                            player.color, player.vel.x, player.vel.y)
-                    self.trail_renderer.add_trail(player.pos.x, player.pos.y,
-                                                 player.color, player.radius, 300)
+                if player.is_dashing:
+                    vel = player.vel
+                    if vel.length_squared() > 10000:
+                        emit_trail(pos.x, pos.y, player.color, vel.x, vel.y)
+                        add_trail(pos.x, pos.y, player.color, player.radius, 300)
                     
         # Collision detection
-        checked_pairs = set()
-        for p1 in alive_players:
-            nearby = self.spatial_grid.get_nearby(p1)
-            for p2 in nearby:
-                if p1 != p2 and p1.alive and p2.alive:
-                    pair = tuple(sorted([id(p1), id(p2)]))
-                    if pair not in checked_pairs:
-                        checked_pairs.add(pair)
-                        
-                        if check_collision(p1, p2):
-                            resolve_collision(p1, p2)
-                            
-                            # Enhanced collision effects
-                            mid_x = (p1.pos.x + p2.pos.x) / 2
-                            mid_y = (p1.pos.y + p2.pos.y) / 2
-                            impact = min(1.0, (p1.vel.length() + p2.vel.length()) / 1000)
-                            
-                            # Particles
-                            self.particles.emit(mid_x, mid_y, (255, 255, 255), 
-                                              count=int(10 + impact * 20), 
-                                              speed=150 + impact * 200)
-                            
-                            # Impact ring effect
-                            self.impact_effects.add_impact(mid_x, mid_y, (255, 255, 255),
-                                                          size=30 + int(impact * 30))
-                            
-                            # Screen effects
-                            self.screen_shake.add_trauma(0.3 * impact)
-                            if impact > 0.6:
-                                self.screen_shake.hitstop(40)
-                                if self.enable_vfx:
-                                    self.vfx_manager.add_chromatic_aberration(0.5, 200)
-                                    self.vfx_manager.add_bloom(0.3, 300)
-                                
-                            self.sound_manager.play_collision(impact)
-                            self.hud.add_hit()
+        pairs = self._find_collision_pairs(alive_players)
+        resolve_collisions(alive_players, pairs)
+        
+        # Gather impacts first, then dispatch their effects in one pass
+        impacts = []
+        for i, j in pairs:
+            p1 = alive_players[i]
+            p2 = alive_players[j]
+            pos1 = p1.pos
+            pos2 = p2.pos
+            impact = min(1.0, (p1.vel.length() + p2.vel.length()) / 1000)
+            impacts.append(((pos1.x + pos2.x) / 2, (pos1.y + pos2.y) / 2, impact))
+            
+        if impacts:
+            self._play_impacts(impacts)
                     
         # Check win condition
         if len(alive_players) <= 1:
@@ -277,6 +332,86 @@ class GameScene(Scene):
             game_state = self._capture_game_state()
             self.replay_recorder.record_frame(game_state)
         
+    def _play_impacts(self, impacts):
+        """Collision effects for this frame's (x, y, impact) list"""
+        particles = self.particles
+        impact_effects = self.impact_effects
+        hud = self.hud
+        
+        total_impact = 0.0
+        max_impact = 0.0
+        for mid_x, mid_y, impact in impacts:
+            # Particles
+            particles.emit(mid_x, mid_y, (255, 255, 255), 
+                           count=int(10 + impact * 20), 
+                           speed=150 + impact * 200)
+            
+            # Impact ring effect
+            impact_effects.add_impact(mid_x, mid_y, (255, 255, 255),
+                                      size=30 + int(impact * 30))
+            
+            hud.add_hit()
+            total_impact += impact
+            max_impact = max(max_impact, impact)
+            
+        # Screen effects (trauma adds up and saturates at 1.0 either way)
+        self.screen_shake.add_trauma(0.3 * total_impact)
+        if max_impact > 0.6:
+            self.screen_shake.hitstop(40)
+            if self.enable_vfx:
+                self.vfx_manager.add_chromatic_aberration(0.5, 200)
+                self.vfx_manager.add_bloom(0.3, 300)
+                
+        # One collision sound per frame, at the strongest impact
+        self.sound_manager.play_collision(max_impact)
+            
+    def _allocate_broad_phase(self):
+        """Size the broad-phase buffers and spatial grid for self.players"""
+        self._pos_xy = np.empty((len(self.players), 2), dtype=np.float32)
+        self._radii = np.empty(len(self.players), dtype=np.float32)
+        self.spatial_grid.configure(self.players)
+        
+    def _find_collision_pairs(self, alive_players):
+        """Broad phase: index pairs of colliding alive players"""
+        count = len(alive_players)
+        
+        if count <= SCALAR_MAX_PLAYERS:
+            xs = [p.pos.x for p in alive_players]
+            ys = [p.pos.y for p in alive_players]
+            radii = [p.radius for p in alive_players]
+            return find_colliding_pairs_scalar(xs, ys, radii)
+            
+        if count <= BRUTE_FORCE_MAX_PLAYERS:
+            pos_xy = self._pos_xy[:count]
+            radii = self._radii[:count]
+            for i, player in enumerate(alive_players):
+                pos_xy[i, 0] = player.pos.x
+                pos_xy[i, 1] = player.pos.y
+                radii[i] = player.radius
+            return find_colliding_pairs(pos_xy, radii)
+            
+        # Spatial grid for larger crowds
+        self.spatial_grid.clear()
+        for i, player in enumerate(alive_players):
+            self.spatial_grid.insert(i, player.pos.x, player.pos.y)
+            
+        # Each pair is tested once, from its lower index
+        pairs = []
+        for i, p1 in enumerate(alive_players):
+            nearby = self.spatial_grid.get_nearby(i)
+            for j in nearby:
+                if j <= i:
+                    continue
+                p2 = alive_players[j]
+                
+                # Inlined check_collision
+                dx = p2.pos.x - p1.pos.x
+                dy = p2.pos.y - p1.pos.y
+                min_distance = p1.radius + p2.radius
+                if dx * dx + dy * dy < min_distance * min_distance:
+                    pairs.append((i, int(j)))
+        return pairs
+            
     def _apply_powerup(self, player, powerup_type):
         """Apply power-up effect to player"""
         if powerup_type == PowerUpType.SPEED_BOOST:
@@ -320,11 +455,9 @@ class GameScene(Scene):
             winner.kills += 1
             
             # Victory effects
-            for _ in range(150):
-                angle = random.uniform(0, 360)
-                speed = random.uniform(150, 500)
-                self.particles.emit(winner.pos.x, winner.pos.y, winner.color,
-                                  count=1, speed=speed, lifetime=2000, gravity=300)
+            self.particles.emit(winner.pos.x, winner.pos.y, winner.color,
+                              count=150, speed_range=(150, 500),
+                              lifetime=2000, gravity=300)
                 
             # Victory VFX
             if self.enable_vfx:
@@ -337,23 +470,29 @@ class GameScene(Scene):
         # Stop recording
         if self.is_recording:
             self.replay_recorder.stop_recording()
+            
+        self._build_game_over_texts()
                 
     def _capture_game_state(self):
-        """Capture current game state for replay"""
+        """Capture current game state for replay
+        
+        Player state is written into a reused (players, STATE_FIELDS) buffer
+        that the recorder copies.
+        """
+        state = self._replay_state
+        for i, p in enumerate(self.players):
+            row = state[i]
+            row[0] = p.pos.x
+            row[1] = p.pos.y
+            row[2] = p.vel.x
+            row[3] = p.vel.y
+            row[4] = p.alive
+            row[5] = p.is_dashing
         return {
             'platform_radius': self.platform.radius,
             'round_time': self.round_time,
-            'players': [
-                {
-                    'pos_x': p.pos.x,
-                    'pos_y': p.pos.y,
-                    'vel_x': p.vel.x,
-                    'vel_y': p.vel.y,
-                    'alive': p.alive,
-                    'is_dashing': p.is_dashing,
-                    'color': p.color
-                } for p in self.players
-            ]
+            'players': state,
+            'colors': self._replay_colors
         }
             
     def render(self, screen):
@@ -386,13 +525,10 @@ class GameScene(Scene):
             
         # Recording indicator
         if self.is_recording:
-            rec_text = pygame.font.Font(None, 24).render("● REC", True, (255, 0, 0))
-            screen.blit(rec_text, (SCREEN_WIDTH - 80, 10))
+            screen.blit(self.rec_text, (SCREEN_WIDTH - 80, 10))
             
         # VFX status indicator
-        vfx_text = pygame.font.Font(None, 20).render(
-            f"VFX: {'ON' if self.enable_vfx else 'OFF'} (V to toggle)", 
-            True, (150, 150, 150))
+        vfx_text = self.vfx_texts[bool(self.enable_vfx)]
         screen.blit(vfx_text, (SCREEN_WIDTH - 200, SCREEN_HEIGHT - 25))
     
     def _render_direct(self, screen, offset_x, offset_y):
@@ -412,8 +548,16 @@ class GameScene(Scene):
     def _render_with_vfx(self, screen, offset_x, offset_y):
         """Render with VFX post-processing"""
         try:
-            # Create game surface
-            game_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            vfx_manager = self.vfx_manager
+            if not vfx_manager.has_active_effects():
+                # Only the vignette applies: draw straight to the cleared
+                # screen and darken it in place, skipping the offscreen pass
+                self._render_direct(screen, offset_x, offset_y)
+                vfx_manager.apply_vignette(screen, vfx_manager.vignette_intensity)
+                return
+                
+            # Reuse the VFX manager's offscreen game surface
+            game_surface = vfx_manager.game_surface
             game_surface.fill(COLORS['BG'])
             
             # Render game elements to surface
@@ -428,27 +572,8 @@ class GameScene(Scene):
                 if player.alive:
                     player.render(game_surface, offset_x, offset_y)
             
-            # Apply VFX post-processing
-            processed_surface = game_surface.copy()
-            
-            if self.vfx_manager.chromatic_aberration > 0:
-                processed_surface = self.vfx_manager.apply_chromatic_aberration(
-                    processed_surface, self.vfx_manager.chromatic_aberration)
-                
-            if self.vfx_manager.bloom_intensity > 0:
-                processed_surface = self.vfx_manager.apply_bloom(
-                    processed_surface, self.vfx_manager.bloom_intensity)
-                
-            if self.vfx_manager.distortion > 0:
-                processed_surface = self.vfx_manager.apply_distortion(
-                    processed_surface, self.vfx_manager.distortion)
-            
-            # Apply vignette
-            processed_surface = self.vfx_manager.apply_vignette(
-                processed_surface, self.vfx_manager.vignette_intensity)
-            
-            # Blit to screen
-            screen.blit(processed_surface, (0, 0))
+            # Apply VFX post-processing and blit to screen
+            vfx_manager.render(screen, game_surface)
             
         except Exception as e:
             print(f"⚠️ VFX rendering failed: {e}")
@@ -458,56 +583,51 @@ class GameScene(Scene):
     def _render_countdown(self, screen):
         """Render countdown with effects"""
         if self.countdown > 0:
-            font = pygame.font.Font(None, 200)
-            text = font.render(str(self.countdown), True, COLORS['HIGHLIGHT'])
+            text = self.countdown_texts[self.countdown]
             
             scale = 1.8 - (self.countdown_time / 1000) * 0.8
-            scaled_text = pygame.transform.scale(text, 
-                (int(text.get_width() * scale), int(text.get_height() * scale)))
+            if scale < 1.02:
+                scaled_text = text  # Resampling would be indistinguishable
+            else:
+                scaled_text = pygame.transform.scale(text, 
+                    (int(text.get_width() * scale), int(text.get_height() * scale)))
             
+            # Glow is baked into the cached sprite, so this is a single blit
             rect = scaled_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
-            
-            # Glow effect
-            for offset in [(3, 3), (-3, -3), (3, -3), (-3, 3)]:
-                screen.blit(scaled_text, (rect.x + offset[0], rect.y + offset[1]))
-                
             screen.blit(scaled_text, rect)
         else:
-            font = pygame.font.Font(None, 120)
-            text = font.render("FIGHT!", True, (255, 100, 100))
+            text = self.fight_text
             rect = text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
             screen.blit(text, rect)
             
-    def _render_game_over(self, screen):
-        """Render enhanced game over screen"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(200)
-        screen.blit(overlay, (0, 0))
-        
-        font_large = pygame.font.Font(None, 100)
-        font_medium = pygame.font.Font(None, 40)
-        font_small = pygame.font.Font(None, 28)
-        
+    def _build_game_over_texts(self):
+        """Render the game over texts once; they cannot change until restart"""
         if self.winner:
-            text = font_large.render(f"PLAYER {self.winner.player_id + 1} WINS!", 
+            text = self.font_large.render(f"PLAYER {self.winner.player_id + 1} WINS!", 
                                     True, self.winner.color)
         else:
-            text = font_large.render("DRAW!", True, COLORS['TEXT'])
+            text = self.font_large.render("DRAW!", True, COLORS['TEXT'])
             
         rect = text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 80))
-        screen.blit(text, rect)
+        blits = [(text, rect)]
         
         # Stats
         if self.winner and hasattr(self.winner, 'kills'):
-            stats_text = font_small.render(
+            stats_text = self.font_small.render(
                 f"Kills: {self.winner.kills} | Max Combo: {self.hud.combo_tracker.max_combo}",
                 True, (200, 200, 200))
             stats_rect = stats_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 20))
-            screen.blit(stats_text, stats_rect)
+            blits.append((stats_text, stats_rect))
         
         # Instructions
-        inst = font_medium.render("R: Restart | ESC: Menu | F1: Save Replay | M: Sound | V: VFX", 
-                                 True, COLORS['TEXT'])
+        inst = self.game_over_inst
         inst_rect = inst.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 80))
-        screen.blit(inst, inst_rect)
\ No newline at end of file
+        blits.append((inst, inst_rect))
+        self.game_over_blits = blits
+            
+    def _render_game_over(self, screen):
+        """Render enhanced game over screen"""
+        # Dim the frame in place: multiplying by 55/255 matches blending a
+        # black overlay at alpha 200, without the overlay surface
+        screen.fill((55, 55, 55), special_flags=pygame.BLEND_RGB_MULT)
+        screen.fblits(self.game_over_blits)
\ No newline at end of file
@@ -3,6 +3,7 @@ Main menu scene
 """
 import pygame
 import random
+import math
 from scenes.scene_manager import Scene
 from config.settings import (
     SCREEN_WIDTH, SCREEN_HEIGHT, COLORS, PLAYER_COUNT,
@@ -27,6 +28,8 @@ class MenuScene(Scene):
         self.selected_index = 0
         self.particles = ParticleSystem()
         self.time = 0
+        self.emit_timer = 0
+        self.color_palette = tuple(COLORS.values())
         
         self.player_count = 2
         self.mode = "menu"
@@ -82,11 +85,14 @@ class MenuScene(Scene):
     def update(self, dt):
         self.time += dt
         
-        if self.time % 100 < dt:
+        # One background particle per 100ms, independent of frame rate
+        self.emit_timer += dt
+        while self.emit_timer >= 100:
+            self.emit_timer -= 100
             self.particles.emit(
                 random.randint(0, SCREEN_WIDTH),
                 random.randint(0, SCREEN_HEIGHT),
-                random.choice(list(COLORS.values())),
+                random.choice(self.color_palette),
                 count=1,
                 speed=20
             )
@@ -115,7 +121,7 @@ class MenuScene(Scene):
             rect = text.get_rect(center=(SCREEN_WIDTH//2, y))
             
             if i == self.selected_index:
-                pulse = abs(pygame.math.Vector2(1, 0).rotate(self.time * 0.2).x)
+                pulse = abs(math.cos(math.radians(self.time * 0.2)))
                 pygame.draw.circle(screen, color, (rect.left - 30, rect.centery), 5 + pulse * 3)
                 
             screen.blit(text, rect)
@@ -2,6 +2,7 @@
 Round results and score display scene
 """
 import pygame
+import math
 from scenes.scene_manager import Scene
 from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, COLORS, PLAYER_COLORS
 from ui.transitions import FadeTransition
@@ -18,46 +19,36 @@ class ResultsScene(Scene):
         self.scores = []
         self.time = 0
         
+        self.inst_text = self.font_small.render(
+            "ENTER to continue | ESC for menu",
+            True,
+            COLORS['TEXT']
+        ).convert_alpha()
+        self.inst_rect = self.inst_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 80))
+        self._build_surfaces()
+        
     def set_results(self, winner_id, scores):
         """Set the results to display"""
         self.winner_id = winner_id
         self.scores = scores[:]
+        self._build_surfaces()
         
-    def on_enter(self):
-        """Reset timer"""
-        self.time = 0
-        
-    def handle_event(self, event):
-        if event.type == pygame.KEYDOWN:
-            if event.key in (pygame.K_RETURN, pygame.K_SPACE):
-                transition = FadeTransition(duration=500)
-                self.scene_manager.change_scene('game', transition)
-            elif event.key == pygame.K_ESCAPE:
-                transition = FadeTransition(duration=500)
-                self.scene_manager.change_scene('menu', transition)
-                
-    def update(self, dt):
-        self.time += dt
-        
-    def render(self, screen):
-        screen.fill(COLORS['BG'])
-        
+    def _build_surfaces(self):
+        """Render the static result texts once per set of results"""
         if self.winner_id is not None:
             winner_text = self.font_large.render(
                 f"PLAYER {self.winner_id + 1} WINS!",
                 True,
                 PLAYER_COLORS[self.winner_id]
             )
-            winner_rect = winner_text.get_rect(center=(SCREEN_WIDTH//2, 150))
-            screen.blit(winner_text, winner_rect)
         else:
-            draw_text = self.font_large.render("DRAW!", True, COLORS['TEXT'])
-            draw_rect = draw_text.get_rect(center=(SCREEN_WIDTH//2, 150))
-            screen.blit(draw_text, draw_rect)
+            winner_text = self.font_large.render("DRAW!", True, COLORS['TEXT'])
+        winner_rect = winner_text.get_rect(center=(SCREEN_WIDTH//2, 150))
+        blits = [(winner_text.convert_alpha(), winner_rect)]
             
         scoreboard_title = self.font_medium.render("SCORES", True, COLORS['TEXT'])
         title_rect = scoreboard_title.get_rect(center=(SCREEN_WIDTH//2, 280))
-        screen.blit(scoreboard_title, title_rect)
+        blits.append((scoreboard_title.convert_alpha(), title_rect))
         
         y = 350
         for i, score in enumerate(self.scores):
@@ -78,20 +69,44 @@ class ResultsScene(Scene):
             player_rect = player_text.get_rect(midright=(SCREEN_WIDTH//2 - 20, y))
             score_rect = score_text.get_rect(midleft=(SCREEN_WIDTH//2 + 20, y))
             
-            screen.blit(player_text, player_rect)
-            screen.blit(score_text, score_rect)
+            blits.append((player_text.convert_alpha(), player_rect))
+            blits.append((score_text.convert_alpha(), score_rect))
             
             y += 50
             
-        alpha = int(200 + 55 * abs(pygame.math.Vector2(1, 0).rotate(self.time * 0.3).x))
-        inst_text = self.font_small.render(
-            "ENTER to continue | ESC for menu",
-            True,
-            COLORS['TEXT']
-        )
-        inst_surface = pygame.Surface(inst_text.get_size(), pygame.SRCALPHA)
-        inst_surface.blit(inst_text, (0, 0))
-        inst_surface.set_alpha(alpha)
+        # Everything but the pulsing instructions, as one screen-sized frame
+        self.static_frame = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.static_frame.fill(COLORS['BG'])
+        self.static_frame.fblits(blits)
+        self.full_redraw = True
+        
+    def on_enter(self):
+        """Reset timer"""
+        self.time = 0
+        self.full_redraw = True
+        
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key in (pygame.K_RETURN, pygame.K_SPACE):
+                transition = FadeTransition(duration=500)
+                self.scene_manager.change_scene('game', transition)
+            elif event.key == pygame.K_ESCAPE:
+                transition = FadeTransition(duration=500)
+                self.scene_manager.change_scene('menu', transition)
+                
+    def update(self, dt):
+        self.time += dt
+        
+    def render(self, screen):
+        # Redraw the whole frame only when something else may have drawn
+        # over it; otherwise just restore the strip behind the instructions
+        transition = self.scene_manager.transition
+        if self.full_redraw or (transition and transition.active):
+            screen.blit(self.static_frame, (0, 0))
+            self.full_redraw = bool(transition and transition.active)
+        else:
+            screen.blit(self.static_frame, self.inst_rect, self.inst_rect)
         
-        inst_rect = inst_surface.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 80))
-        screen.blit(inst_surface, inst_rect)
\ No newline at end of file
+        alpha = int(200 + 55 * abs(math.cos(math.radians(self.time * 0.3))))
+        self.inst_text.set_alpha(alpha)
+        screen.blit(self.inst_text, self.inst_rect)
\ No newline at end of file
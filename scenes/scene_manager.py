@@ -31,13 +31,27 @@ class Scene:
         pass
 
 class SceneManager:
-    """Manages scene transitions and state"""
+    """Manages scene transitions and state
+    
+    The per-frame entry points dispatch through callables bound whenever
+    the state changes (idle, scene, transition), instead of re-testing the
+    transition and scene on every call.
+    """
     def __init__(self):
         self.scenes = {}
         self.current_scene = None
         self.transition = None
         self.next_scene_name = None
         
+        self._handle_event = self._ignore
+        self._update = self._ignore
+        self._render = self._ignore
+        
+    @staticmethod
+    def _ignore(*args):
+        """Entry point for states that do nothing"""
+        pass
+        
     def add_scene(self, name, scene):
         """Register a scene"""
         self.scenes[name] = scene
@@ -51,6 +65,11 @@ class SceneManager:
             self.transition = transition
             self.next_scene_name = name
             self.transition.start(callback=self._complete_transition)
+            
+            # Events are ignored while the transition plays
+            self._handle_event = self._ignore
+            self._update = transition.update
+            self._render = self._render_transition
         else:
             self._switch_scene(name)
             
@@ -62,28 +81,32 @@ class SceneManager:
         self.current_scene = self.scenes[name]
         self.current_scene.on_enter()
         
+        # A running transition keeps control until it completes
+        if not (self.transition and self.transition.active):
+            self._handle_event = self.current_scene.handle_event
+            self._update = self.current_scene.update
+            self._render = self.current_scene.render
+        
     def _complete_transition(self):
         """Called when transition completes"""
         if self.next_scene_name:
             self._switch_scene(self.next_scene_name)
             self.next_scene_name = None
             
+    def _render_transition(self, screen):
+        """Render the current scene with the transition over it"""
+        if self.current_scene:
+            self.current_scene.render(screen)
+        self.transition.render(screen)
+            
     def handle_event(self, event):
         """Forward events to current scene"""
-        if self.current_scene and not (self.transition and self.transition.active):
-            self.current_scene.handle_event(event)
+        self._handle_event(event)
             
     def update(self, dt):
         """Update current scene and transitions"""
-        if self.transition and self.transition.active:
-            self.transition.update(dt)
-        elif self.current_scene:
-            self.current_scene.update(dt)
+        self._update(dt)
             
     def render(self, screen):
         """Render current scene and transitions"""
-        if self.current_scene:
-            self.current_scene.render(screen)
-            
-        if self.transition and self.transition.active:
-            self.transition.render(screen)
\ No newline at end of file
+        self._render(screen)
\ No newline at end of file
@@ -4,10 +4,47 @@ Enhanced particle system with object pooling and advanced effects
 import pygame
 import random
 import math
+import numpy as np
 from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from core.utils import quantize_alpha
+
+# Bursts of at least this many particles are emitted with one vectorized
+# pass; below it the per-particle loop is cheaper than numpy's call overhead
+BATCH_EMIT_MIN = 8
+
+_rng = np.random.default_rng()
+
+_sprite_cache = {}
+
+def _pack_color(color):
+    """Pack an (r, g, b[, a]) color into a 0xRRGGBB int"""
+    return (color[0] << 16) | (color[1] << 8) | color[2]
+
+def _particle_sprite(rgb, radius, alpha):
+    """Pre-drawn particle: faded glow ring around an opaque core
+    
+    rgb is a packed 0xRRGGBB int. Alpha only affects the glow; callers pass
+    it through quantize_alpha to keep the cache small.
+    """
+    key = (rgb, radius, alpha)
+    sprite = _sprite_cache.get(key)
+    if sprite is None:
+        color = ((rgb >> 16) & 0xFF, (rgb >> 8) & 0xFF, rgb & 0xFF)
+        glow_radius = radius + 2
+        sprite = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*color, alpha // 3), 
+                         (glow_radius, glow_radius), glow_radius)
+        pygame.draw.circle(sprite, color, (glow_radius, glow_radius), radius)
+        sprite = sprite.convert_alpha()
+        _sprite_cache[key] = sprite
+    return sprite
 
 class Particle:
-    """Individual particle with enhanced properties"""
+    """Individual particle with enhanced properties
+    
+    Deprecated: ParticleSystem keeps its particles in a pooled array
+    layout and no longer creates these; kept for external callers.
+    """
     def __init__(self):
         self.reset()
         
@@ -90,17 +127,12 @@ class Particle:
         x = int(self.pos.x + offset_x)
         y = int(self.pos.y + offset_y)
         
-        # Create surface with alpha
+        # Glow and core come pre-drawn from the shared sprite cache
         if alpha > 0:
-            # Draw glow effect
             glow_radius = current_radius + 2
-            glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (*self.color, alpha // 3), 
-                             (glow_radius, glow_radius), glow_radius)
-            screen.blit(glow_surface, (x - glow_radius, y - glow_radius))
-            
-            # Draw main particle
-            pygame.draw.circle(screen, (*self.color, alpha), (x, y), current_radius)
+            sprite = _particle_sprite(_pack_color(self.color), current_radius,
+                                      quantize_alpha(alpha))
+            screen.blit(sprite, (x - glow_radius, y - glow_radius))
 
 class ParticleEmitter:
     """Particle emitter with specific behavior"""
@@ -129,37 +161,119 @@ class ParticleEmitter:
             self.accumulator = 0
 
 class ParticleSystem:
-    """Enhanced particle system with object pooling"""
+    """Enhanced particle system with object pooling
+    
+    The pool is stored as a structure of arrays, one numpy column per
+    particle field. Live particles are kept packed in the first
+    active_count slots, so update() and render() only touch that prefix
+    and emit() claims the slots right after it.
+    """
     def __init__(self, pool_size=500):
-        self.particles = [Particle() for _ in range(pool_size)]
+        self.pool_size = pool_size
+        self.pos_x = np.zeros(pool_size, dtype=np.float32)
+        self.pos_y = np.zeros(pool_size, dtype=np.float32)
+        self.vel_x = np.zeros(pool_size, dtype=np.float32)
+        self.vel_y = np.zeros(pool_size, dtype=np.float32)
+        self.color = np.zeros(pool_size, dtype=np.uint32)  # 0xRRGGBB
+        self.age = np.zeros(pool_size, dtype=np.float32)
+        self.lifetime = np.ones(pool_size, dtype=np.float32)
+        self.radius = np.zeros(pool_size, dtype=np.float32)
+        self.gravity = np.zeros(pool_size, dtype=np.float32)
+        self.rotation = np.zeros(pool_size, dtype=np.float32)
+        self.rotation_speed = np.zeros(pool_size, dtype=np.float32)
         self.active_count = 0
         
+        # Every column, for compacting survivors after deaths
+        self.columns = (
+            self.pos_x, self.pos_y, self.vel_x, self.vel_y,
+            self.color,
+            self.age, self.lifetime, self.radius, self.gravity,
+            self.rotation, self.rotation_speed
+        )
+        
     def emit(self, x, y, color, count=10, speed=100, lifetime=1000, 
-             gravity=0, spread=360, direction=None):
-        """Emit particles with various parameters"""
+             gravity=0, spread=360, direction=None, speed_range=None):
+        """Emit particles with various parameters
+        
+        speed_range=(low, high) draws each particle's base speed uniformly
+        from that range instead of using the single speed.
+        """
+        if count >= BATCH_EMIT_MIN:
+            self._emit_batch(x, y, color, count, speed, lifetime, 
+                             gravity, spread, direction, speed_range)
+            return
+            
+        rgb = _pack_color(color)
+        
+        # Angle range in radians, converted once for the whole burst
+        if direction is not None:
+            half_spread = math.radians(spread) / 2
+            angle_min = math.radians(direction) - half_spread
+            angle_max = math.radians(direction) + half_spread
+        else:
+            angle_min = 0.0
+            angle_max = math.tau
+            
         for _ in range(count):
-            # Find inactive particle
-            particle = self._get_inactive_particle()
-            if not particle:
+            # Claim the first free slot
+            i = self.active_count
+            if i >= self.pool_size:
                 break
                 
             # Calculate velocity
-            if direction is not None:
-                angle = direction + random.uniform(-spread/2, spread/2)
-            else:
-                angle = random.uniform(0, 360)
-                
+            angle = random.uniform(angle_min, angle_max)
+            if speed_range is not None:
+                speed = random.uniform(*speed_range)
             vel_magnitude = random.uniform(speed * 0.5, speed * 1.5)
-            vel_x = math.cos(math.radians(angle)) * vel_magnitude
-            vel_y = math.sin(math.radians(angle)) * vel_magnitude
-            velocity = pygame.math.Vector2(vel_x, vel_y)
             
             # Initialize particle
-            radius = random.randint(2, 5)
-            rotation_speed = random.uniform(-360, 360)
-            particle.init(x, y, color, velocity, lifetime, radius, 
-                         gravity, rotation_speed)
+            self.pos_x[i] = x
+            self.pos_y[i] = y
+            self.vel_x[i] = math.cos(angle) * vel_magnitude
+            self.vel_y[i] = math.sin(angle) * vel_magnitude
+            self.color[i] = rgb
+            self.age[i] = 0
+            self.lifetime[i] = lifetime
+            self.radius[i] = random.randint(2, 5)
+            self.gravity[i] = gravity
+            self.rotation_speed[i] = random.uniform(-360, 360)
+            self.rotation[i] = random.uniform(0, 360)
+            self.active_count += 1
             
+    def _emit_batch(self, x, y, color, count, speed, lifetime, 
+                    gravity, spread, direction, speed_range=None):
+        """Vectorized emit: draw all random values for the burst at once"""
+        start = self.active_count
+        count = min(count, self.pool_size - start)
+        if count <= 0:
+            return
+        new = slice(start, start + count)
+        
+        # Calculate velocities (angles drawn directly in radians)
+        if direction is not None:
+            half_spread = math.radians(spread) / 2
+            direction = math.radians(direction)
+            angles = _rng.uniform(direction - half_spread, direction + half_spread, count)
+        else:
+            angles = _rng.uniform(0, math.tau, count)
+        if speed_range is not None:
+            speed = _rng.uniform(speed_range[0], speed_range[1], count)
+        vel_magnitude = _rng.uniform(speed * 0.5, speed * 1.5, count)
+        
+        # Initialize particles
+        self.pos_x[new] = x
+        self.pos_y[new] = y
+        self.vel_x[new] = np.cos(angles) * vel_magnitude
+        self.vel_y[new] = np.sin(angles) * vel_magnitude
+        self.color[new] = _pack_color(color)
+        self.age[new] = 0
+        self.lifetime[new] = lifetime
+        self.radius[new] = _rng.integers(2, 6, count)
+        self.gravity[new] = gravity
+        self.rotation_speed[new] = _rng.uniform(-360, 360, count)
+        self.rotation[new] = _rng.uniform(0, 360, count)
+        self.active_count += count
+        
     def emit_explosion(self, x, y, color, intensity=30):
         """Emit explosion-style particles"""
         self.emit(x, y, color, count=intensity, speed=200, lifetime=800, gravity=100)
@@ -175,32 +289,72 @@ class ParticleSystem:
         """Emit sparkle effect"""
         self.emit(x, y, color, count=5, speed=150, lifetime=600, gravity=-50)
         
-    def _get_inactive_particle(self):
-        """Get an inactive particle from pool"""
-        for particle in self.particles:
-            if not particle.active:
-                return particle
-        return None
-        
     def update(self, dt):
         """Update all active particles"""
-        self.active_count = 0
-        for particle in self.particles:
-            if particle.active:
-                particle.update(dt)
-                if particle.active:
-                    self.active_count += 1
+        n = self.active_count
+        if not n:
+            return
+            
+        dt_sec = dt / 1000.0
+        pos_x = self.pos_x[:n]
+        pos_y = self.pos_y[:n]
+        vel_x = self.vel_x[:n]
+        vel_y = self.vel_y[:n]
+        age = self.age[:n]
+        
+        # Update position
+        pos_x += vel_x * dt_sec
+        pos_y += vel_y * dt_sec
+        
+        # Apply gravity, then air resistance
+        vel_y += self.gravity[:n] * dt_sec
+        vel_x *= 0.98
+        vel_y *= 0.98
+        
+        self.rotation[:n] += self.rotation_speed[:n] * dt_sec
+        age += dt
+        
+        # Kill expired and off-screen particles
+        alive = ((age < self.lifetime[:n]) &
+                 (pos_x >= -50) & (pos_x <= SCREEN_WIDTH + 50) &
+                 (pos_y >= -50) & (pos_y <= SCREEN_HEIGHT + 50))
+        
+        # Pack survivors back to the front, keeping their order
+        survivors = int(np.count_nonzero(alive))
+        if survivors < n:
+            for column in self.columns:
+                column[:survivors] = column[:n][alive]
+            self.active_count = survivors
         
     def render(self, screen, offset_x=0, offset_y=0):
-        """Draw all active particles"""
-        for particle in self.particles:
-            if particle.active:
-                particle.render(screen, offset_x, offset_y)
+        """Draw all active particles in one batched blit"""
+        n = self.active_count
+        if not n:
+            return
+            
+        progress = self.age[:n] / self.lifetime[:n]
+        
+        # Fade out and shrink to half size over the lifetime
+        alphas = np.clip((255 * (1 - progress)).astype(np.int32), 0, 255)
+        visible = alphas > 0
+        alphas = alphas[visible]
+        radii = np.maximum(1, (self.radius[:n][visible] * 
+                               (1 - progress[visible] * 0.5)).astype(np.int32))
+        
+        # Sprites are centred on the particle and span its glow radius
+        xs = (self.pos_x[:n][visible] + offset_x).astype(np.int32) - (radii + 2)
+        ys = (self.pos_y[:n][visible] + offset_y).astype(np.int32) - (radii + 2)
+        colors = self.color[:n][visible].tolist()
+        
+        blits = [
+            (_particle_sprite(color, radius, quantize_alpha(alpha)), (x, y))
+            for x, y, alpha, radius, color in zip(
+                xs.tolist(), ys.tolist(), alphas.tolist(), radii.tolist(), colors)
+        ]
+        screen.fblits(blits)
             
     def clear(self):
         """Clear all particles"""
-        for particle in self.particles:
-            particle.active = False
         self.active_count = 0
         
     def get_active_count(self):
@@ -4,25 +4,46 @@ Replay recording and playback system
 import pygame
 import json
 import time
+import numpy as np
 from pathlib import Path
 
+try:
+    import orjson  # Optional: several times faster replay save/load
+except ImportError:
+    orjson = None
+
+# Columns of the per-player state rows captured each frame
+STATE_FIELDS = ('pos_x', 'pos_y', 'vel_x', 'vel_y', 'alive', 'is_dashing')
+
 class ReplayFrame:
     """Single frame of replay data"""
     def __init__(self, timestamp, game_state):
         self.timestamp = timestamp
-        self.players = []
         self.platform_radius = game_state.get('platform_radius', 300)
         self.round_time = game_state.get('round_time', 0)
         
-        # Record player states
-        for player_data in game_state.get('players', []):
-            self.players.append({
-                'pos': (player_data['pos_x'], player_data['pos_y']),
-                'vel': (player_data['vel_x'], player_data['vel_y']),
-                'alive': player_data['alive'],
-                'is_dashing': player_data.get('is_dashing', False),
-                'color': player_data['color']
-            })
+        # Player states as one (players, STATE_FIELDS) array, copied from
+        # the caller's reusable buffer; per-player dicts are built on demand
+        self.state = np.array(game_state.get('players', ()), dtype=np.float32)
+        self.colors = game_state.get('colors', ())
+        self._players = None
+        
+    @property
+    def players(self):
+        """Per-player dicts (pos, vel, alive, is_dashing, color)"""
+        if self._players is None:
+            self._players = [
+                {
+                    'pos': (pos_x, pos_y),
+                    'vel': (vel_x, vel_y),
+                    'alive': bool(alive),
+                    'is_dashing': bool(is_dashing),
+                    'color': color
+                }
+                for (pos_x, pos_y, vel_x, vel_y, alive, is_dashing), color
+                in zip(self.state.tolist(), self.colors)
+            ]
+        return self._players
             
     def to_dict(self):
         """Convert to dictionary for serialization"""
@@ -33,16 +54,60 @@ class ReplayFrame:
             'round_time': self.round_time
         }
         
+    @classmethod
+    def from_state(cls, timestamp, state, colors, platform_radius, round_time):
+        """Create from a (players, STATE_FIELDS) state array"""
+        frame = cls.__new__(cls)
+        frame.timestamp = timestamp
+        frame.state = state
+        frame.colors = colors
+        frame._players = None
+        frame.platform_radius = platform_radius
+        frame.round_time = round_time
+        return frame
+        
     @classmethod
     def from_dict(cls, data):
-        """Create from dictionary"""
+        """Create from dictionary (per-frame replay format)"""
         frame = cls.__new__(cls)
         frame.timestamp = data['timestamp']
-        frame.players = data['players']
+        frame.state = None
+        frame.colors = [p['color'] for p in data['players']]
+        frame._players = data['players']
         frame.platform_radius = data['platform_radius']
         frame.round_time = data['round_time']
         return frame
 
+class ReplayFrameSequence:
+    """Read-only list of frames backed by a replay's column arrays
+    
+    Frames are built on access, so loading a replay does not create one
+    Python object per recorded frame.
+    """
+    def __init__(self, timestamps, states, colors, platform_radius, round_time):
+        self.timestamps = timestamps
+        self.states = states
+        self.colors = colors
+        self.platform_radius = platform_radius
+        self.round_time = round_time
+        self._last = None
+        
+    def __len__(self):
+        return len(self.timestamps)
+        
+    def __getitem__(self, index):
+        i = range(len(self.timestamps))[index]
+        
+        # Playback asks for the same frame many times in a row
+        if self._last is not None and self._last[0] == i:
+            return self._last[1]
+            
+        frame = ReplayFrame.from_state(
+            float(self.timestamps[i]), self.states[i], self.colors,
+            self.platform_radius[i], self.round_time[i])
+        self._last = (i, frame)
+        return frame
+
 class ReplayRecorder:
     """Records gameplay for replay"""
     def __init__(self):
@@ -67,7 +132,11 @@ class ReplayRecorder:
         self.recording = False
         
     def record_frame(self, game_state):
-        """Record a single frame"""
+        """Record a single frame
+        
+        game_state['players'] is a (players, STATE_FIELDS) array; it is
+        copied, so the caller may reuse its buffer.
+        """
         if not self.recording:
             return
             
@@ -82,13 +151,33 @@ class ReplayRecorder:
         
         filepath = replay_dir / filename
         
+        # Columnar layout: one flat list per state field, frame-major with
+        # len(colors) players per frame, instead of a dict per player-frame
+        frames = self.frames
+        colors = frames[0].colors if frames else []
+        if frames:
+            states = np.stack([frame.state for frame in frames])
+        else:
+            states = np.zeros((0, 0, len(STATE_FIELDS)), dtype=np.float32)
+            
         data = {
             'metadata': self.metadata,
-            'frames': [frame.to_dict() for frame in self.frames]
+            'colors': colors,
+            'timestamps': [frame.timestamp for frame in frames],
+            'platform_radius': [frame.platform_radius for frame in frames],
+            'round_time': [frame.round_time for frame in frames],
+            'players': {
+                field: states[:, :, k].ravel().tolist()
+                for k, field in enumerate(STATE_FIELDS)
+            }
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(data, f)
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(data, f)
             
         return str(filepath)
         
@@ -103,6 +192,7 @@ class ReplayPlayer:
     def __init__(self):
         self.playing = False
         self.frames = []
+        self.timestamps = np.zeros(0)
         self.current_frame_index = 0
         self.playback_time = 0
         self.playback_speed = 1.0
@@ -112,11 +202,20 @@ class ReplayPlayer:
     def load_replay(self, filename):
         """Load replay from file"""
         try:
-            with open(filename, 'r') as f:
-                data = json.load(f)
+            if orjson is not None:
+                with open(filename, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(filename, 'r') as f:
+                    data = json.load(f)
                 
             self.metadata = data['metadata']
-            self.frames = [ReplayFrame.from_dict(frame) for frame in data['frames']]
+            if 'frames' in data:
+                self.frames = [ReplayFrame.from_dict(frame) for frame in data['frames']]
+                self.timestamps = np.array([frame.timestamp for frame in self.frames])
+            else:
+                self.frames = self._frames_from_columns(data)
+                self.timestamps = self.frames.timestamps
             self.current_frame_index = 0
             self.playback_time = 0
             
@@ -125,6 +224,20 @@ class ReplayPlayer:
             print(f"Failed to load replay: {e}")
             return False
             
+    @staticmethod
+    def _frames_from_columns(data):
+        """Wrap the columnar replay format without per-frame objects"""
+        colors = [tuple(color) for color in data['colors']]
+        timestamps = np.array(data['timestamps'], dtype=np.float64)
+        shape = (len(timestamps), len(colors))
+        states = np.stack([
+            np.asarray(data['players'][field], dtype=np.float32).reshape(shape)
+            for field in STATE_FIELDS
+        ], axis=2)
+        
+        return ReplayFrameSequence(timestamps, states, colors,
+                                   data['platform_radius'], data['round_time'])
+        
     def start_playback(self):
         """Start replay playback"""
         self.playing = True
@@ -147,13 +260,10 @@ class ReplayPlayer:
     def seek(self, timestamp):
         """Seek to specific timestamp"""
         self.playback_time = timestamp
-        self.current_frame_index = 0
         
-        # Find closest frame
-        for i, frame in enumerate(self.frames):
-            if frame.timestamp > timestamp:
-                self.current_frame_index = max(0, i - 1)
-                break
+        # Last frame at or before the timestamp (timestamps are sorted)
+        i = int(np.searchsorted(self.timestamps, timestamp, side='right'))
+        self.current_frame_index = max(0, i - 1)
                 
     def update(self, dt):
         """Update playback"""
@@ -163,10 +273,9 @@ class ReplayPlayer:
         # Advance playback time
         self.playback_time += (dt / 1000.0) * self.playback_speed
         
-        # Find current frame
-        while (self.current_frame_index < len(self.frames) and 
-               self.frames[self.current_frame_index].timestamp < self.playback_time):
-            self.current_frame_index += 1
+        # Find current frame: the first one at or after the playback time
+        self.current_frame_index = int(np.searchsorted(
+            self.timestamps, self.playback_time, side='left'))
             
         # Check if replay ended
         if self.current_frame_index >= len(self.frames):
@@ -193,6 +302,14 @@ class ReplayUI:
         self.font = pygame.font.Font(None, 24)
         self.font_small = pygame.font.Font(None, 18)
         
+        # Static labels, plus caches for the few values that change
+        self.pause_surf = self.font.render("PAUSED", True, (255, 200, 50))
+        help_text = "SPACE: Pause | +/-: Speed | R: Restart | ESC: Exit"
+        self.help_surf = self.font_small.render(help_text, True, (180, 180, 180))
+        self.speed_surfs = {}
+        self.time_key = None
+        self.time_surf = None
+        
     def render_controls(self, screen, replay_player):
         """Render replay controls"""
         if not replay_player.playing:
@@ -202,10 +319,10 @@ class ReplayUI:
         bar_height = 80
         bar_y = screen.get_height() - bar_height
         
-        # Semi-transparent background
-        bg = pygame.Surface((screen.get_width(), bar_height), pygame.SRCALPHA)
-        bg.fill((0, 0, 0, 200))
-        screen.blit(bg, (0, bar_y))
+        # Semi-transparent background: darkening in place matches blending
+        # black at alpha 200 without allocating an overlay surface
+        screen.fill((55, 55, 55), (0, bar_y, screen.get_width(), bar_height),
+                    pygame.BLEND_RGB_MULT)
         
         # Progress bar
         progress = replay_player.get_progress()
@@ -220,26 +337,29 @@ class ReplayUI:
         fill_width = int(bar_width * progress)
         pygame.draw.rect(screen, (100, 200, 255), (bar_x, progress_y, fill_width, 10))
         
-        # Time display
+        # Time display (re-rendered only when the whole seconds change)
         current_time = replay_player.playback_time
         total_time = replay_player.frames[-1].timestamp if replay_player.frames else 0
         
-        time_text = f"{int(current_time)}s / {int(total_time)}s"
-        time_surf = self.font.render(time_text, True, (255, 255, 255))
-        screen.blit(time_surf, (bar_x, progress_y + 20))
+        time_key = (int(current_time), int(total_time))
+        if time_key != self.time_key:
+            self.time_key = time_key
+            self.time_surf = self.font.render(f"{time_key[0]}s / {time_key[1]}s", 
+                                              True, (255, 255, 255))
+        screen.blit(self.time_surf, (bar_x, progress_y + 20))
         
         # Speed display
-        speed_text = f"Speed: {replay_player.playback_speed:.2f}x"
-        speed_surf = self.font.render(speed_text, True, (255, 255, 255))
+        speed = replay_player.playback_speed
+        speed_surf = self.speed_surfs.get(speed)
+        if speed_surf is None:
+            speed_surf = self.font.render(f"Speed: {speed:.2f}x", True, (255, 255, 255))
+            self.speed_surfs[speed] = speed_surf
         screen.blit(speed_surf, (bar_x + 150, progress_y + 20))
         
         # Pause indicator
         if replay_player.paused:
-            pause_text = self.font.render("PAUSED", True, (255, 200, 50))
-            pause_rect = pause_text.get_rect(center=(screen.get_width() // 2, progress_y + 25))
-            screen.blit(pause_text, pause_rect)
+            pause_rect = self.pause_surf.get_rect(center=(screen.get_width() // 2, progress_y + 25))
+            screen.blit(self.pause_surf, pause_rect)
             
         # Controls help
-        help_text = "SPACE: Pause | +/-: Speed | R: Restart | ESC: Exit"
-        help_surf = self.font_small.render(help_text, True, (180, 180, 180))
-        screen.blit(help_surf, (bar_x, progress_y + 50))
\ No newline at end of file
+        screen.blit(self.help_surf, (bar_x, progress_y + 50))
\ No newline at end of file
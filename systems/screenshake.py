@@ -38,6 +38,10 @@ class ScreenShake:
             self.hitstop_elapsed += dt
             return dt * 0.1  # Return slowed time
             
+        # Idle: nothing to decay, and the oscillation phase is irrelevant
+        if self.trauma <= 0:
+            return dt
+            
         # Decay trauma
         self.trauma = max(0, self.trauma - self.trauma_decay * dt / 1000.0)
         self.time += dt
@@ -46,23 +50,26 @@ class ScreenShake:
         
     def get_offset(self):
         """Get current shake offset using Perlin-like noise"""
-        if self.trauma <= 0:
+        # Shake amount based on trauma squared (for smoother falloff); below
+        # 1e-4 the offset stays under 0.01px, so skip the trig entirely
+        shake = self.trauma * self.trauma
+        if shake < 1e-4:
             return 0, 0
             
-        # Shake amount based on trauma squared (for smoother falloff)
-        shake = self.trauma * self.trauma
+        amplitude = self.max_offset * shake
         
         # Use sine waves for smooth oscillation
         time_factor = self.time * self.shake_frequency / 1000.0
         
         offset_x = (math.sin(time_factor * 2.1) + 
-                   math.sin(time_factor * 3.7)) * self.max_offset * shake
+                   math.sin(time_factor * 3.7)) * amplitude
         offset_y = (math.cos(time_factor * 1.9) + 
-                   math.cos(time_factor * 4.3)) * self.max_offset * shake
+                   math.cos(time_factor * 4.3)) * amplitude
         
         # Add some randomness for chaos
-        offset_x += random.uniform(-1, 1) * self.max_offset * shake * 0.3
-        offset_y += random.uniform(-1, 1) * self.max_offset * shake * 0.3
+        chaos = amplitude * 0.3
+        offset_x += (random.random() * 2.0 - 1.0) * chaos
+        offset_y += (random.random() * 2.0 - 1.0) * chaos
         
         return offset_x, offset_y
         
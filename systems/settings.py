@@ -5,10 +5,30 @@ import pygame
 import json
 from pathlib import Path
 
+try:
+    import orjson  # Optional: faster settings encode/decode
+except ImportError:
+    orjson = None
+
+# Minimum time between throttled settings writes (ms)
+SAVE_INTERVAL = 500
+
+# Key names used in the controls settings, built once instead of per lookup
+KEY_MAP = {
+    'w': pygame.K_w, 's': pygame.K_s, 'a': pygame.K_a, 'd': pygame.K_d,
+    'up': pygame.K_UP, 'down': pygame.K_DOWN, 
+    'left': pygame.K_LEFT, 'right': pygame.K_RIGHT,
+    'lshift': pygame.K_LSHIFT, 'rshift': pygame.K_RSHIFT,
+    'space': pygame.K_SPACE, 'enter': pygame.K_RETURN,
+    'escape': pygame.K_ESCAPE
+}
+
 class GameSettings:
     """Game settings manager"""
     def __init__(self):
         self.config_file = Path('config.json')
+        self.dirty = False
+        self.last_save_time = -SAVE_INTERVAL
         
         # Default settings
         self.settings = {
@@ -54,21 +74,41 @@ class GameSettings:
         """Load settings from file"""
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r') as f:
-                    loaded = json.load(f)
-                    # Merge with defaults
-                    self._merge_settings(loaded)
+                if orjson is not None:
+                    with open(self.config_file, 'rb') as f:
+                        loaded = orjson.loads(f.read())
+                else:
+                    with open(self.config_file, 'r') as f:
+                        loaded = json.load(f)
+                # Merge with defaults
+                self._merge_settings(loaded)
             except Exception as e:
                 print(f"Failed to load settings: {e}")
                 
     def save_settings(self):
         """Save settings to file"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            if orjson is not None:
+                with open(self.config_file, 'wb') as f:
+                    f.write(orjson.dumps(self.settings, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.config_file, 'w') as f:
+                    json.dump(self.settings, f, indent=2)
+            self.dirty = False
+            self.last_save_time = pygame.time.get_ticks()
         except Exception as e:
             print(f"Failed to save settings: {e}")
             
+    def maybe_save(self):
+        """Save pending changes, at most once per SAVE_INTERVAL"""
+        if self.dirty and pygame.time.get_ticks() - self.last_save_time >= SAVE_INTERVAL:
+            self.save_settings()
+            
+    def flush(self):
+        """Save pending changes immediately"""
+        if self.dirty:
+            self.save_settings()
+            
     def _merge_settings(self, loaded):
         """Merge loaded settings with defaults"""
         for category, values in loaded.items():
@@ -89,6 +129,7 @@ class GameSettings:
         if category not in self.settings:
             self.settings[category] = {}
         self.settings[category][key] = value
+        self.dirty = True
         
     def apply_video_settings(self):
         """Apply video settings"""
@@ -100,15 +141,7 @@ class GameSettings:
         
     def get_key_code(self, key_name):
         """Convert key name to pygame constant"""
-        key_map = {
-            'w': pygame.K_w, 's': pygame.K_s, 'a': pygame.K_a, 'd': pygame.K_d,
-            'up': pygame.K_UP, 'down': pygame.K_DOWN, 
-            'left': pygame.K_LEFT, 'right': pygame.K_RIGHT,
-            'lshift': pygame.K_LSHIFT, 'rshift': pygame.K_RSHIFT,
-            'space': pygame.K_SPACE, 'enter': pygame.K_RETURN,
-            'escape': pygame.K_ESCAPE
-        }
-        return key_map.get(key_name.lower(), pygame.K_SPACE)
+        return KEY_MAP.get(key_name.lower(), pygame.K_SPACE)
 
 class SettingsMenu:
     """Settings menu UI"""
@@ -148,10 +181,31 @@ class SettingsMenu:
             ]
         }
         
+        # Static text is rendered once; value labels are memoized as seen
+        self.title_surf = self.font_title.render("SETTINGS", True, (255, 255, 255))
+        self.tab_surfs = {category: self.font_item.render(category, True, (255, 255, 255))
+                          for category in self.categories}
+        self.name_surfs = {name: self.font_item.render(name, True, (255, 255, 255))
+                           for items in self.items.values() for name, _, _ in items}
+        self.inst_surf = self.font_small.render(
+            "ARROW KEYS: Navigate | ENTER: Select | ESC: Back", True, (180, 180, 180))
+        self.value_surfs = {}
+        
+    def _value_surf(self, value_text):
+        """Rendered value label, cached by its text"""
+        surf = self.value_surfs.get(value_text)
+        if surf is None:
+            if len(self.value_surfs) >= 64:
+                self.value_surfs.clear()
+            surf = self.font_item.render(value_text, True, (100, 200, 255))
+            self.value_surfs[value_text] = surf
+        return surf
+        
     def handle_input(self, event):
         """Handle menu input"""
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
+                self.settings.flush()
                 return 'back'
             elif event.key in (pygame.K_UP, pygame.K_w):
                 self.selected_item = (self.selected_item - 1) % len(self.get_current_items())
@@ -195,7 +249,8 @@ class SettingsMenu:
                 new_value = min(1.0, current + 0.1)
                 self.settings.set(category, key, new_value)
                 
-        self.settings.save_settings()
+        # Rapid toggles are coalesced; leaving the menu flushes the rest
+        self.settings.maybe_save()
         
     def get_current_items(self):
         """Get items for current category"""
@@ -211,7 +266,7 @@ class SettingsMenu:
         screen.fill((20, 20, 30))
         
         # Title
-        title = self.font_title.render("SETTINGS", True, (255, 255, 255))
+        title = self.title_surf
         title_rect = title.get_rect(center=(screen_width // 2, 50))
         screen.blit(title, title_rect)
         
@@ -229,7 +284,7 @@ class SettingsMenu:
             pygame.draw.rect(screen, (255, 255, 255), tab_rect, 2)
             
             # Tab text
-            tab_text = self.font_item.render(category, True, (255, 255, 255))
+            tab_text = self.tab_surfs[category]
             text_rect = tab_text.get_rect(center=(x + tab_width // 2, tab_y + 20))
             screen.blit(tab_text, text_rect)
             
@@ -248,7 +303,7 @@ class SettingsMenu:
                 pygame.draw.rect(screen, (100, 200, 255), highlight, 2)
                 
             # Setting name
-            name_text = self.font_item.render(name, True, (255, 255, 255))
+            name_text = self.name_surfs[name]
             screen.blit(name_text, (100, y))
             
             # Setting value
@@ -267,11 +322,10 @@ class SettingsMenu:
             else:
                 value_text = "Configure"
                 
-            value_surf = self.font_item.render(value_text, True, (100, 200, 255))
+            value_surf = self._value_surf(value_text)
             screen.blit(value_surf, (screen_width - 400, y))
             
         # Instructions
-        inst_text = "ARROW KEYS: Navigate | ENTER: Select | ESC: Back"
-        inst_surf = self.font_small.render(inst_text, True, (180, 180, 180))
+        inst_surf = self.inst_surf
         inst_rect = inst_surf.get_rect(center=(screen_width // 2, screen_height - 40))
         screen.blit(inst_surf, inst_rect)
\ No newline at end of file
@@ -2,8 +2,96 @@
 Enhanced sound manager with procedural audio generation
 """
 import pygame
-import math
+import hashlib
+import os
+import tempfile
+import threading
 import numpy as np
+from pathlib import Path
+
+# Bump when the synthesis code changes so stale cached PCM is not reused
+SOUND_CACHE_VERSION = 1
+
+# Distinct collision tones; intensity within a bucket only scales volume
+COLLISION_PITCHES = 3
+
+# Every sound the game plays, by key: ('tone' | 'sweep', generator args)
+SOUND_SPECS = {
+    'elimination': ('sweep', (400, 100, 500, 0.3)),
+    'dash': ('sweep', (300, 600, 150, 0.25)),
+    'select': ('tone', (440, 50, 0.15, 'sine')),
+    'move': ('tone', (330, 30, 0.1, 'sine')),
+    'victory': ('sweep', (440, 880, 800, 0.3)),
+    'shrink': ('tone', (220, 200, 0.15, 'sawtooth')),
+}
+# Higher pitch for stronger collision, tuned to the bucket centre
+SOUND_SPECS.update({
+    f'collision_{level}': ('tone', (200 + (level + 0.5) / COLLISION_PITCHES * 200,
+                                    100, 0.2, 'square'))
+    for level in range(COLLISION_PITCHES)
+})
+SOUND_SPECS.update({
+    f'countdown_{number}': ('tone', (440 + (3 - number) * 110, 100, 0.2, 'square'))
+    for number in range(4)
+})
+
+# Waveforms as functions of elapsed cycles (frequency * t), in [-1, 1]
+WAVEFORMS = {
+    'sine': lambda cycles: np.sin(2 * np.pi * cycles),
+    'square': lambda cycles: np.where(np.sin(2 * np.pi * cycles) > 0, 1.0, -1.0),
+    'triangle': lambda cycles: 2 * np.abs(2 * (cycles % 1) - 1) - 1,
+    'sawtooth': lambda cycles: 2 * (cycles % 1) - 1,
+}
+
+def _to_channels(value, channels):
+    """int16 samples in the mixer's channel layout from a mono buffer"""
+    samples = np.empty((len(value), channels), dtype=np.int16)
+    samples[:] = value[:, None]
+    return samples[:, 0] if channels == 1 else samples
+
+def _tone_samples(frequency, duration, volume, wave_type, sample_rate, channels):
+    """int16 samples for a tone with an in/out fade"""
+    n_samples = int(duration * sample_rate / 1000)
+    max_sample = 2**(16 - 1) - 1
+    
+    t = np.arange(n_samples) / sample_rate
+    cycles = frequency * t
+    
+    wave = WAVEFORMS.get(wave_type)
+    value = wave(cycles) if wave else np.zeros(n_samples)
+        
+    # Apply envelope (fade in/out)
+    envelope = np.ones(n_samples)
+    fade_duration = min(n_samples // 10, 1000)
+    if fade_duration:
+        envelope[:fade_duration] = np.arange(fade_duration) / fade_duration
+        envelope[n_samples - fade_duration + 1:] = (
+            np.arange(fade_duration - 1, 0, -1) / fade_duration)
+        
+    return _to_channels(max_sample * volume * value * envelope, channels)
+
+def _sweep_samples(start_freq, end_freq, duration, volume, sample_rate, channels):
+    """int16 samples for a linear frequency sweep"""
+    n_samples = int(duration * sample_rate / 1000)
+    max_sample = 2**(16 - 1) - 1
+    
+    i = np.arange(n_samples)
+    progress = i / n_samples
+    
+    # Linear frequency sweep, computed in place to avoid temporaries
+    value = progress * (end_freq - start_freq)
+    value += start_freq
+    value *= i * (2 * np.pi / sample_rate)
+    np.sin(value, out=value)
+    
+    # Envelope
+    envelope = progress
+    envelope *= -0.5
+    envelope += 1.0
+    value *= envelope
+    value *= max_sample * volume
+    
+    return _to_channels(value, channels)
 
 class SoundManager:
     """Enhanced sound manager with better audio generation"""
@@ -11,50 +99,68 @@ class SoundManager:
         try:
             pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
             self.enabled = True
+            
+            # pygame.init() may already have opened the mixer with its own
+            # defaults, making init() a no-op, so synthesize in whatever
+            # rate and channel layout the mixer actually runs
+            self.sample_rate, _, self.channels = pygame.mixer.get_init()
         except:
             print("Warning: Audio system failed to initialize")
             self.enabled = False
+            self.sample_rate = 22050
+            self.channels = 2
             
         self.sounds = {}
         self.volume = 0.5
         self.music_volume = 0.3
+        self.cache_dir = Path('cache') / 'sounds'
+        self.rng = np.random.default_rng()
+        
+        # Warm every sound on a background thread so neither startup nor the
+        # frame a sound is first needed waits on synthesis or disk reads; a
+        # sound played before the thread reaches it is generated on the spot
+        self._sounds_lock = threading.Lock()
+        if self.enabled:
+            threading.Thread(target=self.preload, name='sound-preload', daemon=True).start()
+        
+    def _cached_samples(self, build, *args):
+        """Load generated samples from the disk cache, building them on a miss"""
+        key = repr((SOUND_CACHE_VERSION, build.__name__) + args)
+        digest = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+        path = self.cache_dir / f'{digest}.npy'
+        
+        # A missing, truncated or otherwise unreadable entry is just rebuilt
+        try:
+            return np.load(path)
+        except (OSError, ValueError, EOFError):
+            pass
+            
+        samples = build(*args)
+        
+        # Write to a temp file and rename it into place, so an interrupted
+        # save (or another instance sharing the cache) never leaves a
+        # partial entry behind
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    np.save(f, samples)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
+        return samples
         
     def generate_tone(self, frequency, duration, volume=0.3, wave_type='sine'):
         """Generate a tone with different waveforms"""
         if not self.enabled:
             return None
             
-        sample_rate = 22050
-        n_samples = int(duration * sample_rate / 1000)
-        
-        samples = np.zeros((n_samples, 2), dtype=np.int16)
-        max_sample = 2**(16 - 1) - 1
-        
-        for i in range(n_samples):
-            t = float(i) / sample_rate
-            
-            if wave_type == 'sine':
-                value = math.sin(2 * math.pi * frequency * t)
-            elif wave_type == 'square':
-                value = 1 if math.sin(2 * math.pi * frequency * t) > 0 else -1
-            elif wave_type == 'triangle':
-                value = 2 * abs(2 * ((frequency * t) % 1) - 1) - 1
-            elif wave_type == 'sawtooth':
-                value = 2 * ((frequency * t) % 1) - 1
-            else:
-                value = 0
-                
-            # Apply envelope (fade in/out)
-            envelope = 1.0
-            fade_duration = min(n_samples // 10, 1000)
-            if i < fade_duration:
-                envelope = i / fade_duration
-            elif i > n_samples - fade_duration:
-                envelope = (n_samples - i) / fade_duration
-                
-            sample_value = int(max_sample * volume * value * envelope)
-            samples[i] = [sample_value, sample_value]
-            
+        samples = self._cached_samples(_tone_samples, frequency, duration,
+                                       volume, wave_type, self.sample_rate, self.channels)
         return pygame.sndarray.make_sound(samples)
         
     def generate_noise(self, duration, volume=0.2):
@@ -62,12 +168,11 @@ class SoundManager:
         if not self.enabled:
             return None
             
-        sample_rate = 22050
-        n_samples = int(duration * sample_rate / 1000)
+        n_samples = int(duration * self.sample_rate / 1000)
         
-        # Generate random samples
-        samples = np.random.randint(-32768, 32767, (n_samples, 2), dtype=np.int16)
-        samples = (samples * volume).astype(np.int16)
+        # Generate mono random samples and duplicate them into every channel
+        mono = self.rng.integers(-32768, 32767, n_samples, dtype=np.int16)
+        samples = _to_channels(mono * volume, self.channels)
         
         return pygame.sndarray.make_sound(samples)
         
@@ -76,128 +181,101 @@ class SoundManager:
         if not self.enabled:
             return None
             
-        sample_rate = 22050
-        n_samples = int(duration * sample_rate / 1000)
+        samples = self._cached_samples(_sweep_samples, start_freq, end_freq,
+                                       duration, volume, self.sample_rate, self.channels)
+        return pygame.sndarray.make_sound(samples)
         
-        samples = np.zeros((n_samples, 2), dtype=np.int16)
-        max_sample = 2**(16 - 1) - 1
+    def _get_sound(self, key):
+        """Get (generating once) a sound from SOUND_SPECS
         
-        for i in range(n_samples):
-            t = float(i) / sample_rate
-            progress = i / n_samples
-            
-            # Linear frequency sweep
-            freq = start_freq + (end_freq - start_freq) * progress
-            value = math.sin(2 * math.pi * freq * t)
+        Safe to call from the preload thread and the game loop at once: the
+        lock makes sure each sound is generated by only one of them.
+        """
+        sound = self.sounds.get(key)
+        if sound is None and key in SOUND_SPECS:
+            with self._sounds_lock:
+                sound = self.sounds.get(key)
+                if sound is None:
+                    kind, args = SOUND_SPECS[key]
+                    if kind == 'sweep':
+                        sound = self.generate_sweep(*args)
+                    else:
+                        sound = self.generate_tone(*args)
+                    self.sounds[key] = sound
+        return sound
+        
+    def preload(self):
+        """Generate every sound ahead of use (run on the preload thread)"""
+        if not self.enabled:
+            return
             
-            # Envelope
-            envelope = 1.0 - (i / n_samples) * 0.5
+        for key in SOUND_SPECS:
+            self._get_sound(key)
             
-            sample_value = int(max_sample * volume * value * envelope)
-            samples[i] = [sample_value, sample_value]
+    def _play(self, key, volume):
+        """Play a sound at the given volume"""
+        sound = self._get_sound(key)
+        if sound:
+            sound.set_volume(volume)
+            sound.play()
             
-        return pygame.sndarray.make_sound(samples)
-        
     def play_collision(self, intensity=1.0):
         """Play collision sound"""
         if not self.enabled:
             return
             
-        key = f'collision_{int(intensity * 10)}'
-        if key not in self.sounds:
-            # Higher pitch for stronger collision
-            freq = 200 + intensity * 200
-            self.sounds[key] = self.generate_tone(freq, 100, 0.2 * intensity, 'square')
-            
-        if self.sounds[key]:
-            self.sounds[key].set_volume(self.volume)
-            self.sounds[key].play()
+        # A few pitch buckets; loudness follows intensity at playback
+        level = min(int(intensity * COLLISION_PITCHES), COLLISION_PITCHES - 1)
+        self._play(f'collision_{level}', self.volume * intensity)
         
     def play_elimination(self):
         """Play elimination sound"""
         if not self.enabled:
             return
             
-        if 'elimination' not in self.sounds:
-            self.sounds['elimination'] = self.generate_sweep(400, 100, 500, 0.3)
-            
-        if self.sounds['elimination']:
-            self.sounds['elimination'].set_volume(self.volume)
-            self.sounds['elimination'].play()
+        self._play('elimination', self.volume)
         
     def play_dash(self):
         """Play dash sound"""
         if not self.enabled:
             return
             
-        if 'dash' not in self.sounds:
-            self.sounds['dash'] = self.generate_sweep(300, 600, 150, 0.25)
-            
-        if self.sounds['dash']:
-            self.sounds['dash'].set_volume(self.volume)
-            self.sounds['dash'].play()
+        self._play('dash', self.volume)
         
     def play_menu_select(self):
         """Play menu selection sound"""
         if not self.enabled:
             return
             
-        if 'select' not in self.sounds:
-            self.sounds['select'] = self.generate_tone(440, 50, 0.15, 'sine')
-            
-        if self.sounds['select']:
-            self.sounds['select'].set_volume(self.volume)
-            self.sounds['select'].play()
+        self._play('select', self.volume)
             
     def play_menu_move(self):
         """Play menu move sound"""
         if not self.enabled:
             return
             
-        if 'move' not in self.sounds:
-            self.sounds['move'] = self.generate_tone(330, 30, 0.1, 'sine')
-            
-        if self.sounds['move']:
-            self.sounds['move'].set_volume(self.volume)
-            self.sounds['move'].play()
+        self._play('move', self.volume)
             
     def play_victory(self):
         """Play victory jingle"""
         if not self.enabled:
             return
             
-        if 'victory' not in self.sounds:
-            self.sounds['victory'] = self.generate_sweep(440, 880, 800, 0.3)
-            
-        if self.sounds['victory']:
-            self.sounds['victory'].set_volume(self.volume)
-            self.sounds['victory'].play()
+        self._play('victory', self.volume)
             
     def play_countdown(self, number):
         """Play countdown beep"""
         if not self.enabled:
             return
             
-        freq = 440 + (3 - number) * 110
-        key = f'countdown_{number}'
-        if key not in self.sounds:
-            self.sounds[key] = self.generate_tone(freq, 100, 0.2, 'square')
-            
-        if self.sounds[key]:
-            self.sounds[key].set_volume(self.volume)
-            self.sounds[key].play()
+        self._play(f'countdown_{number}', self.volume)
             
     def play_platform_shrink(self):
         """Play platform shrink warning"""
         if not self.enabled:
             return
             
-        if 'shrink' not in self.sounds:
-            self.sounds['shrink'] = self.generate_tone(220, 200, 0.15, 'sawtooth')
-            
-        if self.sounds['shrink']:
-            self.sounds['shrink'].set_volume(self.volume * 0.5)
-            self.sounds['shrink'].play()
+        self._play('shrink', self.volume * 0.5)
         
     def set_volume(self, volume):
         """Set master volume (0.0 to 1.0)"""
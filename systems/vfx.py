@@ -5,13 +5,19 @@ FIXED VERSION - Corrected array handling
 import pygame
 import numpy as np
 import math
+from core.utils import quantize_alpha
+
+# Post-processing downscale factor per vfx_quality setting
+RENDER_SCALES = {'low': 4, 'medium': 2, 'high': 1}
 
 class VFXManager:
     """Advanced visual effects manager"""
-    def __init__(self, screen_width, screen_height):
+    def __init__(self, screen_width, screen_height, quality='high'):
         self.width = screen_width
         self.height = screen_height
+        self.set_quality(quality)
         self.effects = []
+        self._free_effects = []
         
         # Post-processing surfaces
         self.game_surface = pygame.Surface((screen_width, screen_height))
@@ -24,33 +30,35 @@ class VFXManager:
         self.bloom_intensity = 0
         self.distortion = 0
         self.time = 0
+        self._vignette_cache = {}
+        self._radial_sq = None
+        self._bloom_scratch = {}
+        
+    def set_quality(self, quality):
+        """Pick the post-processing resolution for a vfx_quality setting"""
+        self.quality = quality
+        self.render_scale = RENDER_SCALES.get(quality, 1)
+        
+    def _add_effect(self, effect_type, intensity, duration):
+        """Start a timed effect, reusing an expired record when available"""
+        effect = self._free_effects.pop() if self._free_effects else {}
+        effect['type'] = effect_type
+        effect['intensity'] = intensity
+        effect['duration'] = duration
+        effect['elapsed'] = 0
+        self.effects.append(effect)
         
     def add_chromatic_aberration(self, intensity, duration=500):
         """Add chromatic aberration effect"""
-        self.effects.append({
-            'type': 'chromatic',
-            'intensity': intensity,
-            'duration': duration,
-            'elapsed': 0
-        })
+        self._add_effect('chromatic', intensity, duration)
         
     def add_bloom(self, intensity, duration=300):
         """Add bloom/glow effect"""
-        self.effects.append({
-            'type': 'bloom',
-            'intensity': intensity,
-            'duration': duration,
-            'elapsed': 0
-        })
+        self._add_effect('bloom', intensity, duration)
         
     def add_distortion(self, intensity, duration=200):
         """Add screen distortion"""
-        self.effects.append({
-            'type': 'distortion',
-            'intensity': intensity,
-            'duration': duration,
-            'elapsed': 0
-        })
+        self._add_effect('distortion', intensity, duration)
         
     def update(self, dt):
         """Update all effects"""
@@ -61,12 +69,13 @@ class VFXManager:
         self.bloom_intensity = 0
         self.distortion = 0
         
-        for effect in self.effects[:]:
+        expired = False
+        for effect in self.effects:
             effect['elapsed'] += dt
             progress = effect['elapsed'] / effect['duration']
             
             if progress >= 1.0:
-                self.effects.remove(effect)
+                expired = True
             else:
                 # Exponential decay
                 current_intensity = effect['intensity'] * (1 - progress) ** 2
@@ -78,6 +87,20 @@ class VFXManager:
                 elif effect['type'] == 'distortion':
                     self.distortion = max(self.distortion, current_intensity)
                     
+        # Return expired records to the free list
+        if expired:
+            active = []
+            for effect in self.effects:
+                if effect['elapsed'] < effect['duration']:
+                    active.append(effect)
+                else:
+                    self._free_effects.append(effect)
+            self.effects = active
+            
+    def has_active_effects(self):
+        """Whether any pass besides the vignette has work to do"""
+        return self.chromatic_aberration > 0 or self.bloom_intensity > 0 or self.distortion > 0
+        
     def apply_chromatic_aberration(self, surface, intensity):
         """Apply RGB channel separation effect - FIXED VERSION"""
         if intensity <= 0:
@@ -95,24 +118,20 @@ class VFXManager:
             if offset >= width:
                 offset = width - 1
             
-            # Get pixel array (use pixels3d for direct access)
+            # Shift the channels in place on the locked pixel view; only the
+            # moved slabs are copied, and no new surface is created
             arr = pygame.surfarray.pixels3d(surface)
-            result = arr.copy()  # Create writable copy
-            
-            # Apply channel shifts with bounds checking
-            if offset < width:
-                # Shift red channel right
-                result[offset:, :, 0] = arr[:-offset, :, 0]
-                # Shift blue channel left
-                result[:-offset, :, 2] = arr[offset:, :, 2]
+            red = arr[:-offset, :, 0].copy()
+            blue = arr[offset:, :, 2].copy()
             
-            # Green channel stays in place (already copied)
+            # Shift red channel right, blue channel left
+            arr[offset:, :, 0] = red
+            arr[:-offset, :, 2] = blue
             
-            # Clean up the reference to original array
+            # Release the view to unlock the surface
             del arr
             
-            # Convert back to surface
-            return pygame.surfarray.make_surface(result)
+            return surface
             
         except Exception as e:
             print(f"Chromatic aberration error: {e}")
@@ -124,90 +143,135 @@ class VFXManager:
             return surface
         
         try:
-            # Create brightened copy
-            bright = surface.copy()
-            bright.set_alpha(int(intensity * 100))
+            # Downscale and upscale for blur effect, into scratch surfaces
+            # reused across frames (surface alpha is ignored by BLEND_ADD, so
+            # the frame is scaled directly without a copy)
+            size = surface.get_size()
+            scratch = self._bloom_scratch.get(size)
+            if scratch is None:
+                w, h = size
+                scratch = (pygame.Surface((w // 4, h // 4), 0, surface),
+                           pygame.Surface(size, 0, surface))
+                self._bloom_scratch[size] = scratch
+            temp, blurred = scratch
+            pygame.transform.smoothscale(surface, temp.get_size(), temp)
+            pygame.transform.smoothscale(temp, size, blurred)
             
-            # Upscale and downscale for blur effect
-            w, h = surface.get_size()
-            temp = pygame.transform.smoothscale(bright, (w // 4, h // 4))
-            blurred = pygame.transform.smoothscale(temp, (w, h))
+            # Blend onto the frame in place
+            surface.blit(blurred, (0, 0), special_flags=pygame.BLEND_ADD)
             
-            # Blend with original
-            result = surface.copy()
-            result.blit(blurred, (0, 0), special_flags=pygame.BLEND_ADD)
-            
-            return result
+            return surface
         except Exception as e:
             print(f"Bloom error: {e}")
             return surface
         
+    def _radial_distance_sq(self):
+        """Squared distance from screen centre per pixel, 1.0 at the corners
+        
+        Built on first use and shared by every radial effect, so a new
+        intensity only costs a multiply.
+        """
+        if self._radial_sq is None:
+            center_x, center_y = self.width // 2, self.height // 2
+            max_dist = math.sqrt(center_x**2 + center_y**2)
+            
+            xx, yy = np.indices((self.width, self.height), dtype=np.float32)
+            dist = np.hypot(xx - center_x, yy - center_y)
+            dist /= max_dist
+            self._radial_sq = dist * dist
+        return self._radial_sq
+        
+    def _build_vignette(self, intensity):
+        """Opaque multiply mask that darkens towards the screen corners"""
+        alpha = np.minimum(255 * intensity * self._radial_distance_sq(), 255)
+        
+        # BLEND_RGB_MULT by (255 - alpha) is the same as blending black at alpha
+        shade = (255 - alpha.astype(np.uint8))[:, :, None].repeat(3, axis=2)
+        return pygame.surfarray.make_surface(shade).convert()
+        
     def apply_vignette(self, surface, intensity):
         """Apply vignette darkening at edges"""
         if intensity <= 0:
             return surface
         
         try:
-            vignette = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            
-            # Create radial gradient
-            center_x, center_y = self.width // 2, self.height // 2
-            max_dist = math.sqrt(center_x**2 + center_y**2)
-            
-            for y in range(0, self.height, 4):  # Step for performance
-                for x in range(0, self.width, 4):
-                    dist = math.sqrt((x - center_x)**2 + (y - center_y)**2)
-                    alpha = int(255 * intensity * (dist / max_dist) ** 2)
-                    alpha = min(255, alpha)
-                    pygame.draw.rect(vignette, (0, 0, 0, alpha), (x, y, 4, 4))
+            key = round(intensity, 2)
+            vignette = self._vignette_cache.get(key)
+            if vignette is None:
+                vignette = self._build_vignette(key)
+                self._vignette_cache[key] = vignette
             
-            result = surface.copy()
-            result.blit(vignette, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            surface.blit(vignette, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
             
-            return result
+            return surface
         except Exception as e:
             print(f"Vignette error: {e}")
             return surface
         
-    def apply_distortion(self, surface, intensity):
-        """Apply wave distortion effect"""
+    def apply_distortion(self, surface, intensity, scale=1):
+        """Apply wave distortion effect
+        
+        scale is how many screen pixels one surface pixel covers, so the
+        wave keeps its on-screen period on a downscaled surface.
+        """
         if intensity <= 0:
             return surface
         
         try:
-            # Simple wave distortion
-            result = surface.copy()
+            # Simple wave distortion: each pair of rows shifts right by its
+            # wave offset, keeping its original pixels left of the shift
+            width, height = surface.get_size()
+            ys = np.arange(0, height - 2, 2)
+            offsets = (np.sin(ys * (0.1 * scale) + self.time * 0.01) * intensity * 10).astype(np.int32)
+            shifted = offsets > 0
+            if not shifted.any():
+                return surface
             
-            for y in range(0, self.height, 2):
-                offset = int(math.sin(y * 0.1 + self.time * 0.01) * intensity * 10)
-                
-                if abs(offset) > 0 and 0 <= y < self.height - 2:
-                    # Shift row
-                    strip = surface.subsurface((0, y, self.width, min(2, self.height - y)))
-                    
-                    # Calculate target x position with bounds
-                    target_x = max(0, min(offset, self.width - 1))
-                    result.blit(strip, (target_x, y))
+            offsets = np.minimum(offsets[shifted], width - 1)
+            ys = ys[shifted]
             
-            return result
+            # Shift all row pairs that share an offset with one slice copy on
+            # the locked pixel view (transposed so each row is contiguous)
+            pixels = pygame.surfarray.pixels2d(surface)
+            rows_view = pixels.T
+            for offset in np.unique(offsets):
+                rows = ys[offsets == offset]
+                rows = np.concatenate((rows, rows + 1))
+                rows_view[rows, offset:] = rows_view[rows, :-offset]
+            del rows_view, pixels
+            
+            return surface
         except Exception as e:
             print(f"Distortion error: {e}")
             return surface
         
     def render(self, screen, game_surface):
-        """Apply all post-processing effects"""
-        # Start with game surface
-        result = game_surface.copy()
+        """Apply all post-processing effects
         
-        # Apply effects in order
-        if self.chromatic_aberration > 0:
-            result = self.apply_chromatic_aberration(result, self.chromatic_aberration)
-            
-        if self.bloom_intensity > 0:
-            result = self.apply_bloom(result, self.bloom_intensity)
-            
-        if self.distortion > 0:
-            result = self.apply_distortion(result, self.distortion)
+        Passes draw in place on game_surface, which callers refill every
+        frame. Below 'high' quality the chromatic, bloom and distortion
+        passes run on a downscaled copy; the vignette stays full-res.
+        """
+        result = game_surface
+        
+        if self.has_active_effects():
+            scale = self.render_scale
+            if scale > 1:
+                result = pygame.transform.smoothscale(
+                    result, (self.width // scale, self.height // scale))
+                
+            # Apply effects in order (pixel offsets shrink with the surface)
+            if self.chromatic_aberration > 0:
+                result = self.apply_chromatic_aberration(result, self.chromatic_aberration / scale)
+                
+            if self.bloom_intensity > 0:
+                result = self.apply_bloom(result, self.bloom_intensity)
+                
+            if self.distortion > 0:
+                result = self.apply_distortion(result, self.distortion / scale, scale)
+                
+            if scale > 1:
+                result = pygame.transform.smoothscale(result, (self.width, self.height))
             
         # Always apply subtle vignette
         result = self.apply_vignette(result, self.vignette_intensity)
@@ -219,90 +283,206 @@ class VFXManager:
 
 
 class TrailRenderer:
-    """Motion trail renderer for fast-moving objects"""
-    def __init__(self):
-        self.trails = []
+    """Motion trail renderer for fast-moving objects
+    
+    Trail points are stored as numpy columns with the live points packed
+    into the first active_count slots, like ParticleSystem's pool. The
+    columns double in size when they fill up.
+    """
+    _circle_cache = {}
+    
+    def __init__(self, capacity=256):
+        self.active_count = 0
+        self._allocate(capacity)
+        
+    def _allocate(self, capacity):
+        """Allocate empty point columns"""
+        self.capacity = capacity
+        self.pos_x = np.zeros(capacity, dtype=np.float32)
+        self.pos_y = np.zeros(capacity, dtype=np.float32)
+        self.color = np.zeros(capacity, dtype=np.uint32)  # 0xRRGGBB
+        self.radius = np.zeros(capacity, dtype=np.float32)
+        self.lifetime = np.ones(capacity, dtype=np.float32)
+        self.age = np.zeros(capacity, dtype=np.float32)
+        
+        # Every column, for compacting survivors and growing the pool
+        self.columns = (
+            self.pos_x, self.pos_y, self.color,
+            self.radius, self.lifetime, self.age
+        )
+        
+    def _grow(self):
+        """Double the capacity, keeping the live points"""
+        old_columns = self.columns
+        n = self.active_count
+        self._allocate(self.capacity * 2)
+        for old, new in zip(old_columns, self.columns):
+            new[:n] = old[:n]
+        
+    @classmethod
+    def _circle_surface(cls, rgb, radius, alpha):
+        """Get (building once) a cached SRCALPHA trail circle"""
+        key = (rgb, radius, alpha)
+        surf = cls._circle_cache.get(key)
+        if surf is None:
+            color = ((rgb >> 16) & 0xFF, (rgb >> 8) & 0xFF, rgb & 0xFF)
+            surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surf, (*color, alpha), (radius, radius), radius)
+            surf = surf.convert_alpha()
+            cls._circle_cache[key] = surf
+        return surf
         
     def add_trail(self, x, y, color, radius, lifetime=200):
         """Add trail point"""
-        self.trails.append({
-            'pos': (x, y),
-            'color': color,
-            'radius': radius,
-            'lifetime': lifetime,
-            'age': 0
-        })
+        i = self.active_count
+        if i >= self.capacity:
+            self._grow()
+            
+        self.pos_x[i] = x
+        self.pos_y[i] = y
+        self.color[i] = (color[0] << 16) | (color[1] << 8) | color[2]
+        self.radius[i] = radius
+        self.lifetime[i] = lifetime
+        self.age[i] = 0
+        self.active_count = i + 1
         
     def update(self, dt):
         """Update trails"""
-        for trail in self.trails[:]:
-            trail['age'] += dt
-            if trail['age'] >= trail['lifetime']:
-                self.trails.remove(trail)
+        n = self.active_count
+        if not n:
+            return
+            
+        age = self.age[:n]
+        age += dt
+        alive = age < self.lifetime[:n]
+        
+        # Pack survivors back to the front, keeping their order
+        survivors = int(np.count_nonzero(alive))
+        if survivors < n:
+            for column in self.columns:
+                column[:survivors] = column[:n][alive]
+            self.active_count = survivors
                 
     def render(self, screen, offset_x=0, offset_y=0):
         """Render motion trails"""
-        for trail in self.trails:
-            alpha = int(255 * (1 - trail['age'] / trail['lifetime']))
-            radius = int(trail['radius'] * (1 - trail['age'] / trail['lifetime'] * 0.5))
+        n = self.active_count
+        if not n:
+            return
             
-            if radius > 0 and alpha > 0:
-                x = int(trail['pos'][0] + offset_x)
-                y = int(trail['pos'][1] + offset_y)
-                
-                # Create surface with alpha
-                surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-                pygame.draw.circle(surf, (*trail['color'], alpha), (radius, radius), radius)
-                screen.blit(surf, (x - radius, y - radius))
+        # Fade out and shrink to half size over the lifetime
+        progress = self.age[:n] / self.lifetime[:n]
+        alphas = (255 * (1 - progress)).astype(np.int32)
+        radii = (self.radius[:n] * (1 - progress * 0.5)).astype(np.int32)
+        visible = (radii > 0) & (alphas > 0)
+        
+        radii = radii[visible]
+        xs = (self.pos_x[:n][visible] + offset_x).astype(np.int32) - radii
+        ys = (self.pos_y[:n][visible] + offset_y).astype(np.int32) - radii
+        
+        # 16-step alpha buckets keep the circle cache small
+        circle_surface = self._circle_surface
+        blits = [
+            (circle_surface(rgb, radius, quantize_alpha(alpha)), (x, y))
+            for x, y, rgb, radius, alpha in zip(
+                xs.tolist(), ys.tolist(), self.color[:n][visible].tolist(),
+                radii.tolist(), alphas[visible].tolist())
+        ]
+        screen.fblits(blits)
                 
     def clear(self):
         """Clear all trails"""
-        self.trails.clear()
+        self.active_count = 0
 
 
 class ImpactEffect:
-    """Impact/hit effect visualizer"""
-    def __init__(self):
-        self.impacts = []
+    """Impact/hit effect visualizer
+    
+    Impacts live in a fixed ring of preallocated slots stored as numpy
+    columns, so adding one just overwrites the oldest slot. A slot is
+    inactive once its elapsed time reaches its duration.
+    """
+    # Pre-drawn filled + outlined rings, keyed by (color, size, alpha)
+    _ring_cache = {}
+    
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        self.pos_x = np.zeros(capacity, dtype=np.float32)
+        self.pos_y = np.zeros(capacity, dtype=np.float32)
+        self.color = np.zeros(capacity, dtype=np.uint32)  # 0xRRGGBB
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.duration = np.ones(capacity, dtype=np.float32)
+        self.elapsed = np.ones(capacity, dtype=np.float32)
+        self.head = 0
+        self.active_count = 0
         
     def add_impact(self, x, y, color, size=50, duration=300):
         """Add impact effect"""
-        self.impacts.append({
-            'pos': (x, y),
-            'color': color,
-            'size': size,
-            'duration': duration,
-            'elapsed': 0
-        })
+        i = self.head
+        self.head = (i + 1) % self.capacity
+        if self.elapsed[i] >= self.duration[i]:
+            self.active_count += 1
+            
+        self.pos_x[i] = x
+        self.pos_y[i] = y
+        self.color[i] = (color[0] << 16) | (color[1] << 8) | color[2]
+        self.size[i] = size
+        self.duration[i] = duration
+        self.elapsed[i] = 0
+        
+    @classmethod
+    def _ring_surface(cls, rgb, size, alpha):
+        """Get (building once) a cached impact ring: translucent fill plus outline"""
+        key = (rgb, size, alpha)
+        surf = cls._ring_cache.get(key)
+        if surf is None:
+            # Rings are large, so bound the cache rather than keep every size
+            if len(cls._ring_cache) >= 64:
+                cls._ring_cache.clear()
+            color = ((rgb >> 16) & 0xFF, (rgb >> 8) & 0xFF, rgb & 0xFF)
+            surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surf, (*color, alpha // 2), (size, size), size)
+            pygame.draw.circle(surf, (*color, alpha), (size, size), size, 3)
+            surf = surf.convert_alpha()
+            cls._ring_cache[key] = surf
+        return surf
         
     def update(self, dt):
         """Update impacts"""
-        for impact in self.impacts[:]:
-            impact['elapsed'] += dt
-            if impact['elapsed'] >= impact['duration']:
-                self.impacts.remove(impact)
+        if not self.active_count:
+            return
+            
+        elapsed = self.elapsed
+        elapsed[elapsed < self.duration] += dt
+        self.active_count = int(np.count_nonzero(elapsed < self.duration))
                 
     def render(self, screen, offset_x=0, offset_y=0):
-        """Render impact effects"""
-        for impact in self.impacts:
-            progress = impact['elapsed'] / impact['duration']
-            
-            # Expand and fade
-            current_size = int(impact['size'] * (1 + progress * 2))
-            alpha = int(255 * (1 - progress))
+        """Render impact effects, oldest first"""
+        if not self.active_count:
+            return
             
-            x = int(impact['pos'][0] + offset_x)
-            y = int(impact['pos'][1] + offset_y)
-            
-            # Draw expanding ring
-            if alpha > 0:
-                surf = pygame.Surface((current_size * 2, current_size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(surf, (*impact['color'], alpha // 2), 
-                                 (current_size, current_size), current_size)
-                pygame.draw.circle(surf, (*impact['color'], alpha), 
-                                 (current_size, current_size), current_size, 3)
-                screen.blit(surf, (x - current_size, y - current_size))
+        order = (self.head + np.arange(self.capacity)) % self.capacity
+        order = order[self.elapsed[order] < self.duration[order]]
+        progress = self.elapsed[order] / self.duration[order]
+        
+        # Expand and fade
+        sizes = (self.size[order] * (1 + progress * 2)).astype(np.int32)
+        alphas = (255 * (1 - progress)).astype(np.int32)
+        xs = (self.pos_x[order] + offset_x).astype(np.int32)
+        ys = (self.pos_y[order] + offset_y).astype(np.int32)
+        
+        # Draw expanding rings from the cache (16-step alpha buckets)
+        ring_surface = self._ring_surface
+        blits = []
+        for x, y, rgb, current_size, alpha in zip(
+                xs.tolist(), ys.tolist(), self.color[order].tolist(),
+                sizes.tolist(), alphas.tolist()):
+            alpha = quantize_alpha(alpha)
+            if alpha > 0 and current_size > 0:
+                blits.append((ring_surface(rgb, current_size, alpha),
+                              (x - current_size, y - current_size)))
+        screen.fblits(blits)
                 
     def clear(self):
         """Clear all impacts"""
-        self.impacts.clear()
\ No newline at end of file
+        self.elapsed[:] = self.duration
+        self.active_count = 0
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""
+Tests for GameScene's per-frame update with large crowds
+"""
+import math
+import os
+import tempfile
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+from config.controls import PLAYER_CONTROLS
+from entities.player import Player
+from scenes.scene_manager import SceneManager
+import scenes.game_scene as game_scene
+
+class LargeCrowdTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Settings and the sound cache are written relative to the cwd
+        cls._cwd = os.getcwd()
+        cls._tmp = tempfile.TemporaryDirectory()
+        os.chdir(cls._tmp.name)
+        pygame.init()
+        pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+        os.chdir(cls._cwd)
+        cls._tmp.cleanup()
+        
+    def test_update_above_brute_force_limit(self):
+        game = game_scene.GameScene(SceneManager())
+        game._setup_round()
+        game.game_started = True
+        
+        # Pack a crowd past the brute-force limit onto the platform so the
+        # spatial grid path runs and finds plenty of contacts
+        count = game_scene.BRUTE_FORCE_MAX_PLAYERS + 6
+        game.players = []
+        for i in range(count):
+            angle = 2 * math.pi * i / count
+            ring = 60 + 40 * (i % 4)
+            x = SCREEN_WIDTH // 2 + ring * math.cos(angle)
+            y = SCREEN_HEIGHT // 2 + ring * math.sin(angle)
+            game.players.append(Player(x, y, (255, 100, 100), i,
+                                       PLAYER_CONTROLS[i % len(PLAYER_CONTROLS)]))
+        game._allocate_broad_phase()
+        
+        alive = [p for p in game.players if p.alive]
+        self.assertGreater(len(alive), game_scene.BRUTE_FORCE_MAX_PLAYERS)
+        pairs = game._find_collision_pairs(alive)
+        self.assertTrue(pairs)
+        
+        for _ in range(5):
+            game.update(16)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
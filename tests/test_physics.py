@@ -0,0 +1,48 @@
+"""
+Tests for the collision broad phase
+"""
+import random
+import unittest
+
+from core.physics import SpatialGrid, find_colliding_pairs_scalar
+
+class _Body:
+    """Minimal entity with the attributes SpatialGrid.configure reads"""
+    def __init__(self, x, y, radius):
+        self.x = x
+        self.y = y
+        self.radius = radius
+
+class SpatialGridTest(unittest.TestCase):
+    def _grid_pairs(self, grid, bodies):
+        grid.configure(bodies)
+        for i, body in enumerate(bodies):
+            grid.insert(i, body.x, body.y)
+            
+        pairs = set()
+        for i, body in enumerate(bodies):
+            for j in grid.get_nearby(i):
+                j = int(j)
+                other = bodies[j]
+                rsum = body.radius + other.radius
+                if j > i and (other.x - body.x) ** 2 + (other.y - body.y) ** 2 < rsum * rsum:
+                    pairs.add((i, j))
+        return pairs
+        
+    def test_matches_brute_force_above_capacity(self):
+        rng = random.Random(7)
+        grid = SpatialGrid(max_entities=64)
+        
+        for count in (70, 300):
+            bodies = [_Body(rng.uniform(0, 1280), rng.uniform(0, 720), 20)
+                      for _ in range(count)]
+            expected = set(find_colliding_pairs_scalar(
+                [b.x for b in bodies], [b.y for b in bodies], [b.radius for b in bodies]))
+            
+            self.assertGreater(count, 64)
+            self.assertTrue(expected)
+            self.assertEqual(self._grid_pairs(grid, bodies), expected)
+            self.assertGreaterEqual(grid.max_entities, count)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,10 @@
+"""
+Shared font cache for UI widgets
+"""
+import functools
+import pygame
+
+@functools.lru_cache(maxsize=64)
+def get_font(size, name=None):
+    """Font for a size and face, loaded once and shared between widgets"""
+    return pygame.font.Font(name, size)
\ No newline at end of file
@@ -3,7 +3,17 @@ Advanced HUD with combo system, kill feed, and statistics
 """
 import pygame
 import math
+from collections import deque
 from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, COLORS
+from ui.fonts import get_font
+
+# Steps the HUD pulse is quantized to, so pulsing text hits the text cache
+PULSE_LEVELS = 16
+
+def _blits_visible(blits, clip_rect):
+    """Drop (surface, position) pairs that fall entirely outside clip_rect"""
+    return [(surf, dest) for surf, dest in blits
+            if clip_rect.colliderect(surf.get_rect(topleft=dest[:2]))]
 
 class ComboTracker:
     """Tracks combo hits"""
@@ -39,8 +49,28 @@ class ComboTracker:
 class KillFeed:
     """Kill/elimination feed display"""
     def __init__(self):
-        self.events = []
-        self.font = pygame.font.Font(None, 24)
+        # Only the newest five are ever shown, so older ones are dropped on add
+        self.events = deque(maxlen=5)
+        self.font = get_font(24)
+        # Labels repeat across events ("eliminated", reasons, player tags)
+        self.label_cache = {}
+        
+    def _label(self, text, color):
+        """Rendered feed label, kept for reuse by later events"""
+        key = (text, color)
+        surf = self.label_cache.get(key)
+        if surf is None:
+            surf = self.font.render(text, True, color)
+            self.label_cache[key] = surf
+        return surf
+        
+    def _compose(self, fragments):
+        """Draw an event's text fragments onto its translucent panel once"""
+        surf = pygame.Surface((230, 30), pygame.SRCALPHA)
+        surf.fill((0, 0, 0, 150))
+        for text, color, x in fragments:
+            surf.blit(self._label(text, color), (x, 5))
+        return surf.convert_alpha()
         
     def add_kill(self, killer_id, victim_id, killer_color, victim_color):
         """Add kill event"""
@@ -50,7 +80,13 @@ class KillFeed:
             'killer_color': killer_color,
             'victim_color': victim_color,
             'time': 0,
-            'lifetime': 5000
+            'lifetime': 5000,
+            'inv_lifetime': 1 / 5000,
+            'surf': self._compose([
+                (f"P{killer_id + 1}", killer_color, 5),
+                ("eliminated", (200, 200, 200), 45),
+                (f"P{victim_id + 1}", victim_color, 140)
+            ])
         })
         
     def add_elimination(self, player_id, player_color, reason='fell off'):
@@ -60,68 +96,96 @@ class KillFeed:
             'victim_color': player_color,
             'reason': reason,
             'time': 0,
-            'lifetime': 5000
+            'lifetime': 5000,
+            'inv_lifetime': 1 / 5000,
+            'surf': self._compose([
+                (f"P{player_id + 1}", player_color, 5),
+                (reason, (200, 200, 200), 45)
+            ])
         })
         
     def update(self, dt):
         """Update kill feed"""
-        for event in self.events[:]:
+        events = self.events
+        for event in events:
             event['time'] += dt
-            if event['time'] >= event['lifetime']:
-                self.events.remove(event)
+            
+        # Events share one lifetime, so they expire oldest first
+        while events and events[0]['time'] >= events[0]['lifetime']:
+            events.popleft()
                 
-    def render(self, screen):
-        """Render kill feed"""
+    def get_blits(self):
+        """(surface, position) pairs for the visible events"""
         x = SCREEN_WIDTH - 250
         y = 100
         
-        for i, event in enumerate(self.events[-5:]):  # Show last 5
-            # Fade out
-            alpha = int(255 * (1 - event['time'] / event['lifetime']))
-            
-            if 'killer' in event:
-                # Kill event
-                killer_text = self.font.render(f"P{event['killer'] + 1}", True, event['killer_color'])
-                eliminated_text = self.font.render("eliminated", True, (200, 200, 200))
-                victim_text = self.font.render(f"P{event['victim'] + 1}", True, event['victim_color'])
-                
-                # Create surface with alpha
-                surf = pygame.Surface((230, 30), pygame.SRCALPHA)
-                surf.fill((0, 0, 0, 150))
-                
-                surf.blit(killer_text, (5, 5))
-                surf.blit(eliminated_text, (45, 5))
-                surf.blit(victim_text, (140, 5))
-                
-                surf.set_alpha(alpha)
-                screen.blit(surf, (x, y + i * 35))
-            else:
-                # Self-elimination
-                victim_text = self.font.render(f"P{event['victim'] + 1}", True, event['victim_color'])
-                reason_text = self.font.render(event['reason'], True, (200, 200, 200))
-                
-                surf = pygame.Surface((230, 30), pygame.SRCALPHA)
-                surf.fill((0, 0, 0, 150))
-                
-                surf.blit(victim_text, (5, 5))
-                surf.blit(reason_text, (45, 5))
-                
-                surf.set_alpha(alpha)
-                screen.blit(surf, (x, y + i * 35))
+        blits = []
+        for i, event in enumerate(self.events):
+            # Fade out the pre-composed panel
+            surf = event['surf']
+            surf.set_alpha(int(255 * (1 - event['time'] * event['inv_lifetime'])))
+            blits.append((surf, (x, y + i * 35)))
+        return blits
+        
+    def render(self, screen):
+        """Render kill feed"""
+        screen.fblits(self.get_blits())
 
 class AdvancedHUD:
     """Advanced HUD with more information"""
     def __init__(self):
-        self.font_large = pygame.font.Font(None, 48)
-        self.font_medium = pygame.font.Font(None, 32)
-        self.font_small = pygame.font.Font(None, 24)
-        self.font_tiny = pygame.font.Font(None, 18)
+        self.font_large = get_font(48)
+        self.font_medium = get_font(32)
+        self.font_small = get_font(24)
+        self.font_tiny = get_font(18)
         
         self.combo_tracker = ComboTracker()
         self.kill_feed = KillFeed()
         
         # Animation
         self.time = 0
+        self.pulse = 0.0  # shared by the timer warning and combo glow
+        self.clock = pygame.time.Clock()
+        
+        # Rendered text, keyed by (font, text, color)
+        self.text_cache = {}
+        self.panel_cache = {}
+        
+    def _pulse_step(self, low, high):
+        """Map the pulse, quantized to PULSE_LEVELS steps, onto low..high"""
+        level = min(int(self.pulse * PULSE_LEVELS), PULSE_LEVELS - 1)
+        return low + level * (high - low) // (PULSE_LEVELS - 1)
+        
+    def _combo_font(self, combo):
+        """Font sized for a combo count, so combo text renders crisp instead of scaled"""
+        combo = min(combo, 49)
+        return get_font(int(48 * (1.0 + combo / 10.0)))
+        
+    def _timer_panel(self, size):
+        """Translucent timer background, premultiplied for the fast blitter
+        
+        draw.rect ignores the alpha of its color on an opaque screen, so
+        the panel is a cached surface instead, one per timer text size.
+        """
+        panel = self.panel_cache.get(size)
+        if panel is None:
+            panel = pygame.Surface(size, pygame.SRCALPHA)
+            panel.fill((0, 0, 0, 180))
+            panel = panel.convert_alpha().premul_alpha()
+            self.panel_cache[size] = panel
+        return panel
+        
+    def _render_text(self, font, text, color):
+        """Rendered text surface, cached until the cache fills up"""
+        key = (font, text, color)
+        surf = self.text_cache.get(key)
+        if surf is None:
+            if len(self.text_cache) >= 256:
+                self.text_cache.clear()
+            # Match the display format once so cached blits skip conversion
+            surf = font.render(text, True, color).convert_alpha()
+            self.text_cache[key] = surf
+        return surf
         
     def add_hit(self):
         """Add hit to combo"""
@@ -138,6 +202,7 @@ class AdvancedHUD:
     def update(self, dt):
         """Update HUD"""
         self.time += dt
+        self.pulse = abs(math.sin(self.time * 0.01))
         self.combo_tracker.update(dt)
         self.kill_feed.update(dt)
         
@@ -147,48 +212,57 @@ class AdvancedHUD:
         minutes = int(time_left // 60000)
         seconds = int((time_left % 60000) // 1000)
         
-        # Warning color when time is low
+        # Warning color when time is low, stepped like the combo glow so the
+        # pulse reuses PULSE_LEVELS cached renders
         if time_left < 10000:
-            pulse = abs(math.sin(self.time * 0.01))
-            timer_color = (255, int(100 + pulse * 155), 100)
+            timer_color = (255, self._pulse_step(100, 255), 100)
         else:
             timer_color = COLORS['TEXT']
             
-        timer_text = self.font_large.render(f"{minutes}:{seconds:02d}", True, timer_color)
+        timer_text = self._render_text(self.font_large, f"{minutes}:{seconds:02d}", timer_color)
         timer_rect = timer_text.get_rect(midtop=(SCREEN_WIDTH // 2, 20))
         
         # Timer background
         bg_rect = pygame.Rect(timer_rect.left - 10, timer_rect.top - 5,
                              timer_rect.width + 20, timer_rect.height + 10)
-        pygame.draw.rect(screen, (0, 0, 0, 180), bg_rect)
+        screen.blit(self._timer_panel(bg_rect.size), bg_rect,
+                    special_flags=pygame.BLEND_PREMULTIPLIED)
         pygame.draw.rect(screen, COLORS['TEXT'], bg_rect, 2)
         
-        screen.blit(timer_text, timer_rect)
+        # Everything else is plain alpha blits, gathered into one batch
+        blits = [(timer_text, timer_rect)]
         
         # Player stats panel
-        self._render_player_stats(screen, players, scores)
+        blits += self._player_stats_blits(players, scores)
         
         # Combo display
         if self.combo_tracker.combo > 1:
-            self._render_combo(screen)
+            blits += self._combo_blits()
             
         # Kill feed
-        self.kill_feed.render(screen)
+        blits += self.kill_feed.get_blits()
         
         # Performance stats
-        self._render_performance(screen)
+        blits += self._performance_blits()
         
-    def _render_player_stats(self, screen, players, scores):
-        """Render player statistics panel"""
+        screen.fblits(_blits_visible(blits, screen.get_clip()))
+        
+    def _player_stats_blits(self, players, scores):
+        """Player statistics panel blits"""
         panel_width = 200
-        panel_height = 60 * len(players) + 20
         panel_x = 10
         panel_y = 100
         
+        # Rows starting below the screen would never be seen
+        visible_rows = -(-(SCREEN_HEIGHT - panel_y - 10) // 60)
+        players = players[:visible_rows]
+        panel_height = 60 * len(players) + 20
+        
         # Panel background
         panel = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
         panel.fill((0, 0, 0, 180))
         
+        render_text = self._render_text
         y_offset = 10
         for i, player in enumerate(players):
             if i >= len(scores):
@@ -198,38 +272,38 @@ class AdvancedHUD:
             pygame.draw.circle(panel, player.color, (20, y_offset + 20), 12)
             
             # Player number
-            num_text = self.font_small.render(f"P{player.player_id + 1}", True, COLORS['TEXT'])
+            num_text = render_text(self.font_small, f"P{player.player_id + 1}", COLORS['TEXT'])
             panel.blit(num_text, (40, y_offset + 5))
             
             # Score
-            score_text = self.font_medium.render(str(scores[i]), True, player.color)
+            score_text = render_text(self.font_medium, str(scores[i]), player.color)
             panel.blit(score_text, (40, y_offset + 25))
             
             # Status
             if player.alive:
-                status_text = self.font_tiny.render("ALIVE", True, COLORS['HIGHLIGHT'])
+                status_text = render_text(self.font_tiny, "ALIVE", COLORS['HIGHLIGHT'])
                 
                 # Dash charges
-                charges_text = self.font_tiny.render(
-                    f"Dash: {player.dash_charges}", True, (200, 200, 200))
+                charges_text = render_text(
+                    self.font_tiny, f"Dash: {player.dash_charges}", (200, 200, 200))
                 panel.blit(charges_text, (100, y_offset + 35))
             else:
-                status_text = self.font_tiny.render("OUT", True, (100, 100, 100))
+                status_text = render_text(self.font_tiny, "OUT", (100, 100, 100))
                 
             panel.blit(status_text, (100, y_offset + 5))
             
             # K/D ratio
             if hasattr(player, 'kills') and hasattr(player, 'deaths'):
-                kd_text = self.font_tiny.render(
-                    f"K/D: {player.kills}/{player.deaths}", True, (180, 180, 180))
+                kd_text = render_text(
+                    self.font_tiny, f"K/D: {player.kills}/{player.deaths}", (180, 180, 180))
                 panel.blit(kd_text, (100, y_offset + 20))
             
             y_offset += 60
             
-        screen.blit(panel, (panel_x, panel_y))
+        return [(panel, (panel_x, panel_y))]
         
-    def _render_combo(self, screen):
-        """Render combo counter"""
+    def _combo_blits(self):
+        """Combo counter and glow blits"""
         combo = self.combo_tracker.combo
         multiplier = self.combo_tracker.get_multiplier()
         
@@ -237,36 +311,35 @@ class AdvancedHUD:
         x = SCREEN_WIDTH // 2
         y = 100
         
-        # Scale based on combo
-        scale = 1.0 + (combo / 10.0)
+        # Size grows with combo
+        font = self._combo_font(combo)
         
         # Combo text
-        combo_text = self.font_large.render(f"{combo} HIT COMBO!", True, (255, 200, 50))
-        combo_scaled = pygame.transform.scale(combo_text, 
-            (int(combo_text.get_width() * scale), int(combo_text.get_height() * scale)))
-        combo_rect = combo_scaled.get_rect(center=(x, y))
-        
-        # Pulsing effect
-        pulse = abs(math.sin(self.time * 0.01))
-        glow_color = (255, int(150 + pulse * 105), 50)
-        
-        # Draw glow
-        for offset in [(2, 2), (-2, -2), (2, -2), (-2, 2)]:
-            glow_text = self.font_large.render(f"{combo} HIT COMBO!", True, glow_color)
-            glow_scaled = pygame.transform.scale(glow_text,
-                (int(glow_text.get_width() * scale), int(glow_text.get_height() * scale)))
-            screen.blit(glow_scaled, (combo_rect.x + offset[0], combo_rect.y + offset[1]))
-            
-        screen.blit(combo_scaled, combo_rect)
+        text = f"{combo} HIT COMBO!"
+        combo_text = self._render_text(font, text, (255, 200, 50))
+        combo_rect = combo_text.get_rect(center=(x, y))
+        
+        # Pulsing effect; the stepped color keeps the glow text cached
+        glow_color = (255, self._pulse_step(150, 255), 50)
+        glow_text = self._render_text(font, text, glow_color)
+        
+        # Glow, then the text on top
+        blits = [
+            (glow_text, (combo_rect.x + dx, combo_rect.y + dy))
+            for dx, dy in ((2, 2), (-2, -2), (2, -2), (-2, 2))
+        ]
+        blits.append((combo_text, combo_rect))
         
         # Multiplier
-        mult_text = self.font_medium.render(f"x{multiplier:.1f}", True, (255, 255, 100))
-        mult_rect = mult_text.get_rect(center=(x, y + 50))
-        screen.blit(mult_text, mult_rect)
+        mult_text = self._render_text(self.font_medium, f"x{multiplier:.1f}", (255, 255, 100))
+        blits.append((mult_text, mult_text.get_rect(center=(x, y + 50))))
+        return blits
         
-    def _render_performance(self, screen):
-        """Render performance metrics"""
-        fps = int(pygame.time.Clock().get_fps()) if hasattr(pygame.time.Clock(), 'get_fps') else 60
+    def _performance_blits(self):
+        """Performance metrics blits"""
+        # Measure the HUD's own render rate (tick without a limit never sleeps)
+        self.clock.tick()
+        fps = int(self.clock.get_fps())
         
-        perf_text = self.font_tiny.render(f"FPS: {fps}", True, (100, 100, 100))
-        screen.blit(perf_text, (SCREEN_WIDTH - 80, SCREEN_HEIGHT - 25))
\ No newline at end of file
+        perf_text = self._render_text(self.font_tiny, f"FPS: {fps}", (100, 100, 100))
+        return [(perf_text, (SCREEN_WIDTH - 80, SCREEN_HEIGHT - 25))]
\ No newline at end of file
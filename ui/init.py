@@ -1,6 +1,7 @@
 """
 User interface package
 """
+from ui.fonts import get_font
 from ui.hud import HUD
 from ui.menu import Menu
 from ui.transitions import (
@@ -12,6 +13,7 @@ from ui.transitions import (
 )
 
 __all__ = [
+    'get_font',
     'HUD',
     'Menu',
     'Transition',
@@ -3,6 +3,7 @@ Menu system for UI
 """
 import pygame
 from config.settings import COLORS
+from ui.fonts import get_font
 
 class Menu:
     """Generic menu class"""
@@ -10,17 +11,24 @@ class Menu:
         self.items = items
         self.title = title
         self.selected_index = 0
-        self.font_title = pygame.font.Font(None, 80)
-        self.font_item = pygame.font.Font(None, 40)
+        self.font_title = get_font(80)
+        self.font_item = get_font(40)
+        # Rendered title/items, rebuilt only when the selection or anchor changes
+        self._cached_blit_seq = []
+        self._cached_indicator = None
+        self._cached_anchor = None
+        self._dirty = True
         
     def handle_input(self, event):
         """Handle menu input"""
         if event.type == pygame.KEYDOWN:
             if event.key in (pygame.K_UP, pygame.K_w):
                 self.selected_index = (self.selected_index - 1) % len(self.items)
+                self._dirty = True
                 return 'move'
             elif event.key in (pygame.K_DOWN, pygame.K_s):
                 self.selected_index = (self.selected_index + 1) % len(self.items)
+                self._dirty = True
                 return 'move'
             elif event.key in (pygame.K_RETURN, pygame.K_SPACE):
                 return 'select'
@@ -30,23 +38,34 @@ class Menu:
         """Get currently selected item"""
         return self.items[self.selected_index]
         
-    def render(self, screen, center_x, start_y):
-        """Render menu"""
-        # Title
-        title_surf = self.font_title.render(self.title, True, COLORS['TEXT'])
-        title_rect = title_surf.get_rect(center=(center_x, start_y - 100))
-        screen.blit(title_surf, title_rect)
+    def _rebuild(self, center_x, start_y):
+        """Rasterize the title and items for the current selection"""
+        title_surf = self.font_title.render(self.title, True, COLORS['TEXT']).convert_alpha()
+        blit_seq = [(title_surf, title_surf.get_rect(center=(center_x, start_y - 100)))]
         
-        # Menu items
         y = start_y
         for i, item in enumerate(self.items):
             color = COLORS['HIGHLIGHT'] if i == self.selected_index else COLORS['TEXT']
-            text_surf = self.font_item.render(item, True, color)
+            text_surf = self.font_item.render(item, True, color).convert_alpha()
             text_rect = text_surf.get_rect(center=(center_x, y))
             
             # Selection indicator
             if i == self.selected_index:
-                pygame.draw.circle(screen, color, (text_rect.left - 30, text_rect.centery), 5)
+                self._cached_indicator = (color, (text_rect.left - 30, text_rect.centery))
                 
-            screen.blit(text_surf, text_rect)
-            y += 60
\ No newline at end of file
+            blit_seq.append((text_surf, text_rect))
+            y += 60
+            
+        self._cached_blit_seq = blit_seq
+        self._cached_anchor = (center_x, start_y)
+        self._dirty = False
+        
+    def render(self, screen, center_x, start_y):
+        """Render menu"""
+        if self._dirty or self._cached_anchor != (center_x, start_y):
+            self._rebuild(center_x, start_y)
+            
+        if self._cached_indicator:
+            color, pos = self._cached_indicator
+            pygame.draw.circle(screen, color, pos, 5)
+        screen.fblits(self._cached_blit_seq)
\ No newline at end of file
@@ -41,8 +41,6 @@ class FadeTransition(Transition):
     def __init__(self, duration=500, fade_in=False):
         super().__init__(duration)
         self.fade_in = fade_in
-        self.surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.surface.fill((0, 0, 0))
         
     def render(self, screen):
         if not self.active:
@@ -54,14 +52,22 @@ class FadeTransition(Transition):
         else:
             alpha = int(255 * progress)
             
-        self.surface.set_alpha(alpha)
-        screen.blit(self.surface, (0, 0))
+        # Darkening by alpha is a multiply by (255 - alpha), done in place
+        # instead of alpha-blitting a full-screen black surface
+        shade = 255 - alpha
+        if shade < 255:
+            screen.fill((shade, shade, shade), special_flags=pygame.BLEND_RGB_MULT)
 
 class SlideTransition(Transition):
     """Slide screen in/out"""
     def __init__(self, duration=500, direction='left'):
         super().__init__(duration)
         self.direction = direction
+        self.snapshot = None
+        
+    def start(self, callback=None):
+        super().start(callback)
+        self.snapshot = None
         
     def render(self, screen):
         if not self.active:
@@ -72,10 +78,19 @@ class SlideTransition(Transition):
         
         offset = int(SCREEN_WIDTH * progress)
         
-        if self.direction == 'left':
-            screen.scroll(-offset, 0)
+        # Slide a snapshot of the first frame rather than scrolling the
+        # screen, so the result doesn't depend on what is drawn underneath
+        if self.snapshot is None:
+            self.snapshot = screen.copy()
+            
+        if offset >= SCREEN_WIDTH:
+            screen.fill((0, 0, 0))
+        elif self.direction == 'left':
+            screen.blit(self.snapshot, (-offset, 0))
+            screen.fill((0, 0, 0), (SCREEN_WIDTH - offset, 0, offset, SCREEN_HEIGHT))
         elif self.direction == 'right':
-            screen.scroll(offset, 0)
+            screen.blit(self.snapshot, (offset, 0))
+            screen.fill((0, 0, 0), (0, 0, offset, SCREEN_HEIGHT))
 
 class CircleWipe(Transition):
     """Circular wipe transition"""
@@ -84,6 +99,7 @@ class CircleWipe(Transition):
         self.expand = expand
         self.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
         self.max_radius = int(((SCREEN_WIDTH/2)**2 + (SCREEN_HEIGHT/2)**2)**0.5)
+        self.cover_radius = self.max_radius + 1  # reaches past the corners
         
     def render(self, screen):
         if not self.active:
@@ -97,11 +113,13 @@ class CircleWipe(Transition):
         else:
             radius = int(self.max_radius * (1 - progress))
             
-        mask = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        mask.fill((0, 0, 0))
-        pygame.draw.circle(mask, (255, 255, 255), self.center, radius)
-        mask.set_colorkey((255, 255, 255))
-        screen.blit(mask, (0, 0))
+        # Black out everything beyond the radius with one thick ring drawn
+        # straight onto the screen, rather than a colorkeyed full-screen mask
+        if radius <= 0:
+            screen.fill((0, 0, 0))
+        elif radius < self.cover_radius:
+            pygame.draw.circle(screen, (0, 0, 0), self.center, self.cover_radius,
+                               self.cover_radius - radius)
 
 class TransitionManager:
     """Manages multiple transitions"""